@@ -25,11 +25,12 @@ from pathlib import Path
 
 import numpy as np
 import pandas as pd
-import pandas_ta as ta
 
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from utils import kernels  # noqa: E402
+
 
 class NumpyEncoder(json.JSONEncoder):
     """Custom JSON encoder to handle numpy types."""
@@ -45,6 +46,11 @@ class NumpyEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+def _arr(df: pd.DataFrame, col: str) -> np.ndarray:
+    """Column as a contiguous float64 array (kernel input)."""
+    return np.ascontiguousarray(df[col].to_numpy(dtype=np.float64))
+
+
 def find_swing_points(df: pd.DataFrame, window: int = 10) -> tuple[list, list]:
     """Find swing highs and swing lows in price data."""
     highs = []
@@ -194,10 +200,9 @@ def detect_crossovers(df: pd.DataFrame) -> dict:
     df['sma50'] = df['Close'].rolling(50).mean()
     df['sma200'] = df['Close'].rolling(200).mean() if len(df) >= 200 else None
 
-    macd_result = ta.macd(df['Close'], fast=12, slow=26, signal=9)
-    if macd_result is not None:
-        df['macd'] = macd_result.iloc[:, 0]
-        df['macd_signal'] = macd_result.iloc[:, 2]
+    macd_line, macd_signal, _ = kernels.macd(_arr(df, 'Close'), 12, 26, 9)
+    df['macd'] = macd_line
+    df['macd_signal'] = macd_signal
 
     crossovers = {
         "golden_cross": None,
@@ -245,7 +250,7 @@ def generate_trading_levels(df: pd.DataFrame, indicators: dict, support_resistan
     Generate specific entry, stop-loss, and target prices based on technical analysis.
     """
     current_price = df['Close'].iloc[-1]
-    atr = ta.atr(df['High'], df['Low'], df['Close'], length=14).iloc[-1]
+    atr = kernels.atr(_arr(df, 'High'), _arr(df, 'Low'), _arr(df, 'Close'), 14)[-1]
 
     # Determine trend
     sma50 = indicators.get('sma50')
@@ -546,37 +551,36 @@ def compute_deep_analysis(df: pd.DataFrame) -> dict:
         raise ValueError(f"Not enough data: {len(df)} rows, need at least 50")
 
     df = df.copy()
+    close, high, low = _arr(df, 'Close'), _arr(df, 'High'), _arr(df, 'Low')
 
-    # Compute all technical indicators
-    df['rsi'] = ta.rsi(df['Close'], length=14)
+    # Compute all technical indicators (utils.kernels: pandas_ta math on
+    # plain arrays, so this CLI doesn't pay pandas_ta's import cost)
+    df['rsi'] = kernels.rsi(close, 14)
 
     # SMA 20, 50, 200
-    df['sma20'] = ta.sma(df['Close'], length=20)
-    df['sma50'] = ta.sma(df['Close'], length=50)
+    df['sma20'] = kernels.sma(close, 20)
+    df['sma50'] = kernels.sma(close, 50)
     if len(df) >= 200:
-        df['sma200'] = ta.sma(df['Close'], length=200)
+        df['sma200'] = kernels.sma(close, 200)
 
     # MACD
-    macd_result = ta.macd(df['Close'], fast=12, slow=26, signal=9)
-    if macd_result is not None:
-        df['macd'] = macd_result.iloc[:, 0]
-        df['macd_histogram'] = macd_result.iloc[:, 1]
-        df['macd_signal'] = macd_result.iloc[:, 2]
+    macd_line, macd_signal, macd_hist = kernels.macd(close, 12, 26, 9)
+    df['macd'] = macd_line
+    df['macd_histogram'] = macd_hist
+    df['macd_signal'] = macd_signal
 
     # Bollinger Bands
-    bbands = ta.bbands(df['Close'], length=20, std=2)
-    if bbands is not None:
-        df['bb_lower'] = bbands.iloc[:, 0]
-        df['bb_middle'] = bbands.iloc[:, 1]
-        df['bb_upper'] = bbands.iloc[:, 2]
-        df['bb_pctb'] = bbands.iloc[:, 4]
+    bb_lower, bb_middle, bb_upper, _, bb_pctb = kernels.bbands(close, 20, 2.0)
+    df['bb_lower'] = bb_lower
+    df['bb_middle'] = bb_middle
+    df['bb_upper'] = bb_upper
+    df['bb_pctb'] = bb_pctb
 
     # ADX
-    adx_result = ta.adx(df['High'], df['Low'], df['Close'], length=14)
-    if adx_result is not None:
-        df['adx'] = adx_result.iloc[:, 0]
-        df['plus_di'] = adx_result.iloc[:, 1]
-        df['minus_di'] = adx_result.iloc[:, 2]
+    adx, plus_di, minus_di = kernels.adx(high, low, close, 14)
+    df['adx'] = adx
+    df['plus_di'] = plus_di
+    df['minus_di'] = minus_di
 
     # Get latest values
     latest = df.iloc[-1]
@@ -53,6 +53,25 @@ def read_resolved_ids() -> set[str]:
     return resolved
 
 
+def fetch_history(symbols: list[str], start: str) -> pd.DataFrame:
+    """Download daily bars for all symbols in one request.
+
+    Columns are (Price, Ticker), the same layout a single-symbol
+    yf.download() returns, so per-symbol slices from history_for() can be
+    handed straight to resolve_suggestion().
+    """
+    return yf.download(symbols, start=start, progress=False, auto_adjust=True, multi_level_index=True)
+
+
+def history_for(data: pd.DataFrame, sym: str, entry_date: str) -> pd.DataFrame:
+    """Slice one symbol's bars since entry_date out of a fetch_history() frame."""
+    if data.empty or sym not in data.columns.get_level_values(1):
+        return pd.DataFrame()
+    hist = data.xs(sym, axis=1, level=1, drop_level=False)
+    # Other tickers' trading days (e.g. US vs NSE holidays) show up as all-NaN rows
+    return hist.loc[hist.index >= entry_date].dropna(how="all")
+
+
 def resolve_suggestion(entry: dict, current_price: float, hist: pd.DataFrame) -> dict:
     """Check if a suggestion hit target, stop, or expired."""
     now = datetime.now(IST)
@@ -139,12 +158,18 @@ def main():
     symbols = list({e["symbol"] for e in open_entries})
     print(f"Checking {len(open_entries)} open suggestions across {len(symbols)} symbols...", file=sys.stderr)
 
+    entry_dates = {e["id"]: datetime.fromisoformat(e["ts"]).strftime("%Y-%m-%d") for e in open_entries}
+    try:
+        data = fetch_history(symbols, min(entry_dates.values()))
+    except Exception as ex:
+        print(f"  Error fetching prices: {ex}", file=sys.stderr)
+        data = pd.DataFrame()
+
     outcomes = []
     for entry in open_entries:
         sym = entry["symbol"]
-        entry_date = datetime.fromisoformat(entry["ts"]).strftime("%Y-%m-%d")
         try:
-            hist = yf.download(sym, start=entry_date, progress=False, auto_adjust=True)
+            hist = history_for(data, sym, entry_dates[entry["id"]])
             if hist.empty:
                 print(f"  Warning: no data for {sym}", file=sys.stderr)
                 continue
@@ -28,14 +28,13 @@ def analyze_adx(df, length: int = ADX_PERIOD) -> dict:
     if 'adx' not in df.columns:
         return {"error": "Could not compute ADX"}
 
-    latest = df.iloc[-1]
-    prev = df.iloc[-2]
+    adx_arr = df['adx'].to_numpy()
 
-    adx = safe_round(latest['adx'], 2)
-    plus_di = safe_round(latest['plus_di'], 2)
-    minus_di = safe_round(latest['minus_di'], 2)
+    adx = safe_round(adx_arr[-1], 2)
+    plus_di = safe_round(df['plus_di'].to_numpy()[-1], 2)
+    minus_di = safe_round(df['minus_di'].to_numpy()[-1], 2)
 
-    prev_adx = safe_round(prev['adx'], 2)
+    prev_adx = safe_round(adx_arr[-2], 2)
 
     # Trend strength
     if adx is None:
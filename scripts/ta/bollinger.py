@@ -13,6 +13,8 @@ Computes Bollinger Bands (20,2) for mean reversion signals.
 import sys
 from pathlib import Path
 
+import numpy as np
+
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from utils.indicators import compute_all
 from utils.ta_config import BB_PERIOD, BB_STD, BB_LOWER_THRESHOLD, BB_UPPER_THRESHOLD
@@ -27,13 +29,13 @@ def analyze_bollinger(df, length: int = BB_PERIOD, std: float = BB_STD) -> dict:
     if 'bb_lower' not in df.columns:
         return {"error": "Could not compute Bollinger Bands"}
 
-    latest = df.iloc[-1]
-    price = safe_round(latest['Close'], 2)
-    upper = safe_round(latest['bb_upper'], 2)
-    middle = safe_round(latest['bb_middle'], 2)
-    lower = safe_round(latest['bb_lower'], 2)
-    pctb = safe_round(latest['bb_pctb'], 4)
-    bandwidth = safe_round(latest['bb_bandwidth'], 4)
+    bandwidth_arr = df['bb_bandwidth'].to_numpy()
+    price = safe_round(df['Close'].to_numpy()[-1], 2)
+    upper = safe_round(df['bb_upper'].to_numpy()[-1], 2)
+    middle = safe_round(df['bb_middle'].to_numpy()[-1], 2)
+    lower = safe_round(df['bb_lower'].to_numpy()[-1], 2)
+    pctb = safe_round(df['bb_pctb'].to_numpy()[-1], 4)
+    bandwidth = safe_round(bandwidth_arr[-1], 4)
 
     # Determine position and signal
     if pctb is None:
@@ -56,7 +58,7 @@ def analyze_bollinger(df, length: int = BB_PERIOD, std: float = BB_STD) -> dict:
         position = "middle_zone"
 
     # Bandwidth analysis (volatility)
-    avg_bandwidth = df['bb_bandwidth'].tail(20).mean()
+    avg_bandwidth = np.nanmean(bandwidth_arr[-20:])
     bandwidth_expanding = bandwidth > avg_bandwidth * 1.1 if bandwidth and avg_bandwidth else None
     bandwidth_contracting = bandwidth < avg_bandwidth * 0.9 if bandwidth and avg_bandwidth else None
 
@@ -66,9 +66,8 @@ def analyze_entry_points(df: pd.DataFrame) -> dict:
     atr = vals['atr']
 
     # Fibonacci levels
-    recent = df.tail(FIB_LOOKBACK)
-    swing_high = recent['High'].max()
-    swing_low = recent['Low'].min()
+    swing_high = np.nanmax(df['High'].to_numpy()[-FIB_LOOKBACK:])
+    swing_low = np.nanmin(df['Low'].to_numpy()[-FIB_LOOKBACK:])
     fib_diff = swing_high - swing_low
 
     fib_618 = safe_round(swing_high - fib_diff * 0.618, 2)
@@ -12,7 +12,7 @@ Computes Fibonacci retracement levels from swing high/low.
 import sys
 from pathlib import Path
 
-import pandas as pd
+import numpy as np
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from utils.indicators import find_swing_points
@@ -25,13 +25,17 @@ from utils.ta_common import (
 
 def analyze_fibonacci(df, lookback: int = FIB_LOOKBACK) -> dict:
     """Compute Fibonacci retracement levels."""
-    recent = df.tail(lookback)
-    current_price = safe_round(df['Close'].iloc[-1], 2)
-
-    swing_high = recent['High'].max()
-    swing_low = recent['Low'].min()
-    swing_high_date = recent['High'].idxmax()
-    swing_low_date = recent['Low'].idxmin()
+    highs = df['High'].to_numpy()[-lookback:]
+    lows = df['Low'].to_numpy()[-lookback:]
+    recent_index = df.index[-lookback:]
+    current_price = safe_round(df['Close'].to_numpy()[-1], 2)
+
+    hi_pos = np.nanargmax(highs)
+    lo_pos = np.nanargmin(lows)
+    swing_high = highs[hi_pos]
+    swing_low = lows[lo_pos]
+    swing_high_date = recent_index[hi_pos]
+    swing_low_date = recent_index[lo_pos]
 
     # Determine trend direction
     is_uptrend = swing_low_date < swing_high_date
@@ -26,38 +26,38 @@ def analyze_macd(df, fast: int = MACD_FAST, slow: int = MACD_SLOW, signal: int =
     if 'macd' not in df.columns:
         return {"error": "Could not compute MACD"}
 
-    latest = df.iloc[-1]
-    prev = df.iloc[-2]
+    macd_arr = df['macd'].to_numpy()
+    signal_arr = df['macd_signal'].to_numpy()
+    hist_arr = df['macd_hist'].to_numpy()
 
-    macd_val = safe_round(latest['macd'], 4)
-    signal_val = safe_round(latest['macd_signal'], 4)
-    histogram = safe_round(latest['macd_hist'], 4)
+    macd_val = safe_round(macd_arr[-1], 4)
+    signal_val = safe_round(signal_arr[-1], 4)
+    histogram = safe_round(hist_arr[-1], 4)
 
-    prev_macd = safe_round(prev['macd'], 4)
-    prev_signal = safe_round(prev['macd_signal'], 4)
+    prev_macd = safe_round(macd_arr[-2], 4)
+    prev_signal = safe_round(signal_arr[-2], 4)
 
     # Determine crossover
     crossover = None
     crossover_date = None
 
     # Check last 10 days for recent crossover
-    recent = df.tail(10)
-    for i in range(1, len(recent)):
-        curr_row = recent.iloc[i]
-        prev_row = recent.iloc[i-1]
-
-        if prev_row['macd'] <= prev_row['macd_signal'] and curr_row['macd'] > curr_row['macd_signal']:
+    recent_macd = macd_arr[-10:]
+    recent_signal = signal_arr[-10:]
+    recent_index = df.index[-10:]
+    for i in range(1, len(recent_macd)):
+        if recent_macd[i-1] <= recent_signal[i-1] and recent_macd[i] > recent_signal[i]:
             crossover = "bullish"
-            crossover_date = format_date(recent.index[i])
+            crossover_date = format_date(recent_index[i])
 
-        if prev_row['macd'] >= prev_row['macd_signal'] and curr_row['macd'] < curr_row['macd_signal']:
+        if recent_macd[i-1] >= recent_signal[i-1] and recent_macd[i] < recent_signal[i]:
             crossover = "bearish"
-            crossover_date = format_date(recent.index[i])
+            crossover_date = format_date(recent_index[i])
 
     # Current state
     above_signal = macd_val > signal_val if macd_val and signal_val else None
     above_zero = macd_val > 0 if macd_val else None
-    hist_rising = histogram > safe_round(prev['macd_hist'], 4) if histogram else None
+    hist_rising = histogram > safe_round(hist_arr[-2], 4) if histogram else None
 
     # Signal determination
     if above_signal and above_zero and hist_rising:
@@ -24,9 +24,10 @@ def analyze_rsi(df, period: int = RSI_PERIOD) -> dict:
     ind = compute_all(df)
     df = ind['df']
 
-    current = safe_round(df['rsi'].iloc[-1], 2)
-    prev = safe_round(df['rsi'].iloc[-2], 2)
-    prev_5d = safe_round(df['rsi'].iloc[-5], 2) if len(df) >= 5 else None
+    rsi = df['rsi'].to_numpy()
+    current = safe_round(rsi[-1], 2)
+    prev = safe_round(rsi[-2], 2)
+    prev_5d = safe_round(rsi[-5], 2) if len(rsi) >= 5 else None
 
     # Determine signal
     if current is None:
@@ -23,11 +23,14 @@ def analyze_sma_stack(df) -> dict:
     ind = compute_all(df)
     df = ind['df']
 
-    latest = df.iloc[-1]
-    price = safe_round(latest['Close'], 2)
-    sma20 = safe_round(latest['sma20'], 2)
-    sma50 = safe_round(latest['sma50'], 2)
-    sma200 = safe_round(latest.get('sma200'), 2) if 'sma200' in df.columns else None
+    has_sma200 = 'sma200' in df.columns
+    sma50_arr = df['sma50'].to_numpy()
+    sma200_arr = df['sma200'].to_numpy() if has_sma200 else None
+
+    price = safe_round(df['Close'].to_numpy()[-1], 2)
+    sma20 = safe_round(df['sma20'].to_numpy()[-1], 2)
+    sma50 = safe_round(sma50_arr[-1], 2)
+    sma200 = safe_round(sma200_arr[-1], 2) if has_sma200 else None
 
     # Stack alignment check
     stack_bullish = False
@@ -65,17 +68,16 @@ def analyze_sma_stack(df) -> dict:
     golden_cross = None
     death_cross = None
 
-    if 'sma200' in df.columns:
-        recent = df.tail(60)
-        for i in range(1, len(recent)):
-            curr = recent.iloc[i]
-            prev = recent.iloc[i-1]
-
-            if prev['sma50'] <= prev['sma200'] and curr['sma50'] > curr['sma200']:
-                golden_cross = format_date(recent.index[i])
+    if has_sma200:
+        fast = sma50_arr[-60:]
+        slow = sma200_arr[-60:]
+        recent_index = df.index[-60:]
+        for i in range(1, len(fast)):
+            if fast[i-1] <= slow[i-1] and fast[i] > slow[i]:
+                golden_cross = format_date(recent_index[i])
 
-            if prev['sma50'] >= prev['sma200'] and curr['sma50'] < curr['sma200']:
-                death_cross = format_date(recent.index[i])
+            if fast[i-1] >= slow[i-1] and fast[i] < slow[i]:
+                death_cross = format_date(recent_index[i])
 
     # Entry signal based on stack
     entry_signal = None
@@ -13,32 +13,43 @@ Analyzes volume patterns for accumulation/distribution signals.
 import sys
 from pathlib import Path
 
-import pandas_ta as ta
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-from utils.indicators import compute_all
 from utils.ta_config import VOLUME_SMA_PERIOD, VOLUME_SMA_LONG, VOLUME_SPIKE, VOLUME_HIGH
 from utils.ta_common import load_ohlcv, output_result, get_symbol_from_args, safe_round, log, format_date
 
 
 def analyze_volume(df) -> dict:
     """Analyze volume patterns."""
-    ind = compute_all(df)
-    df = ind['df']
-
-    # compute_all() provides vol_sma20 and vol_ratio; add vol_sma50 locally
-    df['vol_sma50'] = ta.sma(df['Volume'], length=VOLUME_SMA_LONG)
-    df['price_change'] = df['Close'].pct_change()
-
-    latest = df.iloc[-1]
-
-    volume = int(latest['Volume'])
-    vol_sma20 = int(latest['vol_sma20']) if latest['vol_sma20'] else None
-    vol_sma50 = int(latest['vol_sma50']) if latest['vol_sma50'] else None
-    vol_ratio = safe_round(latest['vol_ratio'], 2)
-
-    is_up_day = latest['Close'] >= latest['Open']
-    price_change_pct = safe_round(latest['price_change'] * 100, 2)
+    # Plain arrays only — the caller's frame is never copied or widened
+    vol = df['Volume'].to_numpy(dtype=np.float64)
+    close = df['Close'].to_numpy(dtype=np.float64)
+    open_ = df['Open'].to_numpy(dtype=np.float64)
+
+    # 20-day volume SMA for the last 20 bars (spike scan) plus the latest
+    # 50-day mean; NaN where the window is not yet full
+    tail = min(20, len(vol))
+    vol_sma = np.full(tail, np.nan)
+    if len(vol) >= VOLUME_SMA_PERIOD:
+        window = vol[-(tail + VOLUME_SMA_PERIOD - 1):]
+        sma = sliding_window_view(window, VOLUME_SMA_PERIOD).mean(axis=1)
+        vol_sma[tail - len(sma):] = sma
+    ratios = vol[-tail:] / vol_sma
+    vol_sma50_latest = vol[-VOLUME_SMA_LONG:].mean() if len(vol) >= VOLUME_SMA_LONG else np.nan
+
+    # Daily % change for the same tail (first bar has no previous close)
+    prev_close = np.concatenate(([np.nan], close[:-1]))[-tail:]
+    changes = close[-tail:] / prev_close - 1
+
+    volume = int(vol[-1])
+    vol_sma20 = int(vol_sma[-1]) if vol_sma[-1] else None
+    vol_sma50 = int(vol_sma50_latest) if not np.isnan(vol_sma50_latest) else None
+    vol_ratio = safe_round(ratios[-1], 2)
+
+    is_up_day = close[-1] >= open_[-1]
+    price_change_pct = safe_round(changes[-1] * 100, 2)
 
     # Volume signal
     if vol_ratio and vol_ratio > VOLUME_SPIKE:
@@ -57,7 +68,7 @@ def analyze_volume(df) -> dict:
         signal = "normal"
 
     # Volume trend (5-day vs 20-day)
-    vol_5d = df['Volume'].tail(5).mean()
+    vol_5d = vol[-5:].mean()
     vol_trend = None
     if vol_5d and vol_sma20:
         if vol_5d > vol_sma20 * 1.2:
@@ -69,15 +80,16 @@ def analyze_volume(df) -> dict:
 
     # Find recent volume spikes
     recent_spikes = []
-    recent = df.tail(20)
-    for idx, row in recent.iterrows():
-        if row['vol_ratio'] > VOLUME_SPIKE:
-            recent_spikes.append({
-                "date": format_date(idx),
-                "volume_ratio": safe_round(row['vol_ratio'], 2),
-                "price_change_pct": safe_round(row['price_change'] * 100, 2) if row['price_change'] else None,
-                "type": "accumulation" if row['Close'] >= row['Open'] else "distribution",
-            })
+    closes = close[-tail:]
+    opens = open_[-tail:]
+    dates = df.index[-tail:]
+    for i in np.flatnonzero(ratios > VOLUME_SPIKE):
+        recent_spikes.append({
+            "date": format_date(dates[i]),
+            "volume_ratio": safe_round(ratios[i], 2),
+            "price_change_pct": safe_round(changes[i] * 100, 2) if changes[i] else None,
+            "type": "accumulation" if closes[i] >= opens[i] else "distribution",
+        })
 
     # Entry signal based on volume
     entry_signal = None
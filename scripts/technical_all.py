@@ -7,19 +7,101 @@ Usage:
     uv run python scripts/technical_all.py --watchlist-id swing
     uv run python scripts/technical_all.py --symbols RELIANCE.NS TCS.NS
     uv run python scripts/technical_all.py --holdings --watchlist-id swing
+    uv run python scripts/technical_all.py --all-watchlists --workers 4
+    uv run python scripts/technical_all.py --symbols RELIANCE.NS --force
 
 Reads holdings from data/holdings.json and computes technical indicators for each unique symbol.
+Symbols are analyzed in-process across a pool of worker processes.
 """
 
 import json
 import argparse
-import subprocess
+import importlib.util
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from utils.data import load_watchlist, watchlist_symbols, list_watchlists, all_watchlist_symbols  # noqa: E402
 
+SCRIPTS_DIR = Path(__file__).parent
+
+# Modular TA scripts — output saved to data/ta/<symbol>_<name>.json
+# (name, script path relative to scripts/, analyze function)
+TA_SCRIPTS = [
+    ("stoch_rsi",   "ta/stoch_rsi.py",    "analyze_stoch_rsi"),
+    ("divergence",  "ta/divergence.py",   "analyze_divergence"),
+    ("patterns",    "ta/patterns.py",     "analyze_patterns"),
+    ("entry_points","ta/entry_points.py", "analyze_entry_points"),
+]
+
+_script_modules: dict = {}
+
+
+def load_script_module(name: str, rel_path: str):
+    """Import a script as a module (cached per process) without turning scripts/ into a package."""
+    if name not in _script_modules:
+        spec = importlib.util.spec_from_file_location(name, SCRIPTS_DIR / rel_path)
+        if spec is None or spec.loader is None:
+            raise RuntimeError(f"Could not load module spec for {rel_path}")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _script_modules[name] = module
+    return _script_modules[name]
+
+
+def analyze_symbol(
+    symbol: str, weights: dict, weight_vector: tuple[float, ...], force: bool = False,
+) -> tuple[bool, bool]:
+    """
+    Run core scoring + modular TA scripts for one symbol in-process.
+
+    Core scoring reuses data/technical/<symbol>.json when the parquet and
+    weights are unchanged, unless `force` is set.
+
+    Returns (core_ok, ta_ok). Modular TA failures are non-fatal.
+    """
+    from utils.data import CACHE_DIR, load_ohlcv, save_ta
+
+    # Decode the parquet once and share the frame between core scoring and
+    # the modular scripts (each symbol lives in exactly one worker, so there
+    # is nothing to gain from decoding in the parent and shipping it over)
+    df = load_ohlcv(symbol)
+    path = CACHE_DIR / f"{symbol}.parquet"
+    if df is None:
+        # load_ohlcv() returns None for a missing parquet and for one it rejects as too short
+        skip_reason = f"OHLCV data rejected by loader: {path}" if path.exists() else f"OHLCV data not found: {path}"
+    elif df.attrs.get("symbol") != symbol:
+        skip_reason = f"OHLCV data not found: {path} (found {df.attrs.get('symbol')} instead)"
+        df = None  # Resolved via a suffix fallback; let core report the exact path
+    elif len(df) < 50:
+        skip_reason = f"Insufficient data: {len(df)} rows, need 50+"
+    else:
+        skip_reason = None
+
+    core = load_script_module("technical_analysis", "technical_analysis.py")
+    try:
+        core.run_for_symbol(symbol, weights, quiet=True, df=df, force=force, weight_vector=weight_vector)
+    except Exception as e:
+        print(f"{symbol}: core analysis failed: {e}", file=sys.stderr)
+        return False, False
+
+    ta_ok = True
+    if skip_reason:
+        print(f"{symbol}: {skip_reason}", file=sys.stderr)
+        return True, False
+
+    for name, rel_path, func_name in TA_SCRIPTS:
+        try:
+            analyze = getattr(load_script_module(name, rel_path), func_name)
+            save_ta(symbol, name, analyze(df))
+        except Exception as e:
+            print(f"{symbol}: {name} failed: {e}", file=sys.stderr)
+            ta_ok = False  # Non-fatal — core analysis still counts
+
+    return True, ta_ok
+
 
 def normalize_yf_symbol(symbol: str, default_suffix: str) -> str:
     s = symbol.strip().upper()
@@ -67,6 +149,17 @@ def main():
         default=[],
         help="Explicit Yahoo Finance tickers to analyze (e.g., RELIANCE.NS MSFT).",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Recompute core scores even if data/technical/<symbol>.json is up to date.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Parallel worker processes (default: CPU count).",
+    )
     args = parser.parse_args()
 
     holdings_file = base_path / "data" / "holdings.json"
@@ -112,47 +205,31 @@ def main():
 
     print(f"Running technical analysis for {total} unique symbols...")
 
-    # New modular TA scripts — output saved to data/ta/<symbol>_<name>.json
-    TA_SCRIPTS = [
-        ("stoch_rsi",  "scripts/ta/stoch_rsi.py"),
-        ("divergence", "scripts/ta/divergence.py"),
-        ("patterns",   "scripts/ta/patterns.py"),
-        ("entry_points","scripts/ta/entry_points.py"),
-    ]
-    ta_dir = base_path / "data" / "ta"
-    ta_dir.mkdir(parents=True, exist_ok=True)
+    # Load weights once in the parent instead of re-parsing per symbol
+    core = load_script_module("technical_analysis", "technical_analysis.py")
+    weights_path = base_path / "config" / "technical_weights.csv"
+    weights = core.load_technical_weights(weights_path)
+    weight_vector = core.load_technical_weight_vector(weights_path)
+
+    # Compile the numba kernels once here so forked workers inherit them
+    from utils.kernels import warmup
+    warmup()
 
     success = 0
     failed = []
 
-    for i, symbol in enumerate(unique_symbols, 1):
-        print(f"[{i}/{total}] Analyzing {symbol}...", end=" ", flush=True)
-
-        # Core scoring script (RSI, MACD, SMA, Bollinger, ADX, Volume → weighted score)
-        result = subprocess.run(
-            ["uv", "run", "python", "scripts/technical_analysis.py", symbol],
-            capture_output=True, text=True, cwd=base_path
+    workers = max(1, min(args.workers, total))
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        results = ex.map(
+            analyze_symbol, unique_symbols, [weights] * total, [weight_vector] * total, [args.force] * total,
         )
-        if result.returncode != 0:
-            print("FAILED (core)")
-            failed.append(symbol)
-            continue
-
-        # Modular TA scripts (StochRSI, divergence, patterns, entry points)
-        ta_ok = True
-        for name, script in TA_SCRIPTS:
-            ta_result = subprocess.run(
-                ["uv", "run", "python", script, symbol],
-                capture_output=True, text=True, cwd=base_path
-            )
-            if ta_result.returncode == 0 and ta_result.stdout.strip():
-                out_path = ta_dir / f"{symbol}_{name}.json"
-                out_path.write_text(ta_result.stdout.strip(), encoding="utf-8")
-            else:
-                ta_ok = False  # Non-fatal — core analysis still counts
-
-        print("OK" if ta_ok else "OK (some ta scripts skipped)")
-        success += 1
+        for i, (symbol, (core_ok, ta_ok)) in enumerate(zip(unique_symbols, results), 1):
+            if not core_ok:
+                print(f"[{i}/{total}] {symbol}: FAILED (core)")
+                failed.append(symbol)
+                continue
+            print(f"[{i}/{total}] {symbol}: " + ("OK" if ta_ok else "OK (some ta scripts skipped)"))
+            success += 1
 
     print(f"\nComplete: {success}/{total} succeeded")
     if failed:
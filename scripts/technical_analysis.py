@@ -3,7 +3,7 @@
 Technical Analysis Script - Computes technical indicators for a stock.
 
 Usage:
-    uv run python scripts/technical_analysis.py <symbol>
+    uv run python scripts/technical_analysis.py <symbol> [--force]
 
 Example:
     uv run python scripts/technical_analysis.py RELIANCE.NS
@@ -11,23 +11,67 @@ Example:
 Output:
     Writes analysis to data/technical/<symbol>.json
     Prints JSON to stdout
+
+The saved JSON records the OHLCV parquet's mtime and size plus a
+fingerprint of the scoring code; if none of them (nor the weights)
+changed since, the saved result is reused. --force recomputes regardless.
 """
 
 import csv
+import functools
 import json
+import math
 import sys
+import zlib
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from utils.indicators import compute_all
-from utils.ta_config import RSI_PERIOD, MACD_FAST, MACD_SLOW, MACD_SIGNAL, BB_PERIOD, BB_STD, ADX_PERIOD, SMA_FAST, SMA_MID, SMA_SLOW
-from utils.helpers import save_json
+from utils.kernels import (
+    technical_scalars,
+    SCORE_KEYS,
+    RSI_THRESHOLDS, RSI_SCORES,
+    MACD_SCORES,
+    BB_THRESHOLDS, BB_SCORES,
+    ADX_THRESHOLDS, ADX_UP_SCORES, ADX_DN_SCORES,
+    VOL_THRESHOLDS, VOL_UP_SCORES, VOL_DN_SCORES,
+)
 from utils.config import DEFAULT_TECHNICAL_WEIGHTS as DEFAULT_WEIGHTS
+from utils import kernels, ta_config
+
+BASE_PATH = Path(__file__).parent.parent
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+
+@functools.cache
+def output_version() -> int:
+    """Fingerprint of the code and parameters behind a saved analysis.
+
+    Covers the ta_config parameters and the source of this script (the
+    scorers) and utils/kernels.py (indicators, score tables), so changing
+    any of them stops load_fresh_output() reusing older results.
+    """
+    params = {k: v for k, v in vars(ta_config).items() if k.isupper()}
+    version = zlib.crc32(repr(params).encode())
+    for src in (Path(__file__), Path(kernels.__file__)):
+        version = zlib.crc32(src.read_bytes(), version)
+    return version
+
+
+def dumps_output(output: dict) -> bytes:
+    """Serialize an analysis result as 2-space indented JSON."""
+    return json.dumps(output, indent=2, default=str).encode()
+
+
+def order_weights(weights: dict) -> tuple[float, ...]:
+    """Weights as a tuple in SCORE_KEYS order (kernels.score_batch layout)."""
+    return tuple(weights[key] for key in SCORE_KEYS)
 
 
 def load_technical_weights(config_path: Path) -> dict:
@@ -36,7 +80,25 @@ def load_technical_weights(config_path: Path) -> dict:
 
     Returns dict mapping indicator name to weight.
     Falls back to equal weights if config file is missing or invalid.
+    The CSV is parsed once per process; each call gets its own copy.
     """
+    return dict(_parse_technical_weights(str(config_path))[0])
+
+
+def load_technical_weight_vector(config_path: Path) -> tuple[float, ...]:
+    """Same weights as load_technical_weights(), normalized and in SCORE_KEYS order."""
+    return _parse_technical_weights(str(config_path))[1]
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_technical_weights(config_path: str) -> tuple[dict, tuple[float, ...]]:
+    """Parsed weights dict plus its SCORE_KEYS-ordered vector (memoized; callers must not mutate)."""
+    weights = _read_technical_weights(Path(config_path))
+    return weights, order_weights(weights)
+
+
+def _read_technical_weights(config_path: Path) -> dict:
+    """Parse + validate the weights CSV."""
     if not config_path.exists():
         print(f"Config file not found at {config_path}, using equal weights", file=sys.stderr)
         return DEFAULT_WEIGHTS.copy()
@@ -72,6 +134,11 @@ def load_technical_weights(config_path: Path) -> dict:
         return DEFAULT_WEIGHTS.copy()
 
 
+def _isnan(val) -> bool:
+    """Scalar NaN/None check (pd.isna's dtype dispatch is ~20x slower)."""
+    return val is None or math.isnan(val)
+
+
 def score_rsi(rsi: float) -> int:
     """
     Score RSI on 1-10 scale (trend-aligned, not mean-reversion).
@@ -81,20 +148,15 @@ def score_rsi(rsi: float) -> int:
     - Pullback zone (25-35) is ideal entry in confirmed uptrend
     - Overbought is caution for new entries, not bearish
     """
-    if pd.isna(rsi):
+    # <25: 4 extreme oversold (potential falling knife)
+    # <35: 7 pullback zone (ideal entry in uptrend)
+    # <55: 6 healthy momentum
+    # <70: 5 neutral-to-strong
+    # <80: 4 overbought (not ideal entry)
+    # else: 3 extreme overbought
+    if _isnan(rsi):
         return 5
-    if rsi < 25:
-        return 4   # Extreme oversold - potential falling knife
-    elif rsi < 35:
-        return 7   # Pullback zone - ideal entry in uptrend
-    elif rsi < 55:
-        return 6   # Healthy momentum
-    elif rsi < 70:
-        return 5   # Neutral-to-strong
-    elif rsi < 80:
-        return 4   # Overbought - not ideal entry
-    else:
-        return 3   # Extreme overbought
+    return int(RSI_SCORES[np.searchsorted(RSI_THRESHOLDS, rsi, side="right")])
 
 
 def score_macd(macd: float, signal: float, prev_macd: float, prev_signal: float) -> int:
@@ -106,23 +168,17 @@ def score_macd(macd: float, signal: float, prev_macd: float, prev_signal: float)
     - Rising vs falling (momentum strength)
     - Above vs below zero (trend context)
     """
-    if pd.isna(macd) or pd.isna(signal):
+    if _isnan(macd) or _isnan(signal):
         return 5
 
     macd_above_signal = macd > signal
-    rising = macd > prev_macd if not pd.isna(prev_macd) else True
+    rising = macd > prev_macd if not _isnan(prev_macd) else True
     above_zero = macd > 0
 
-    if macd_above_signal and rising and above_zero:
-        return 9   # Full bullish - above zero, rising, above signal
-    elif macd_above_signal and rising:
-        return 7   # Recovering - rising but below zero
-    elif macd_above_signal:
-        return 5   # Momentum fading - above signal but not rising
-    elif above_zero:
-        return 4   # Pullback in uptrend - below signal but above zero
-    else:
-        return 2   # Full bearish - below zero and below signal
+    # above signal + rising: 9 above zero (full bullish) / 7 below (recovering)
+    # above signal, not rising: 5 momentum fading
+    # below signal: 4 above zero (pullback in uptrend) / 2 below (full bearish)
+    return int(MACD_SCORES[(macd_above_signal << 2) | (rising << 1) | above_zero])
 
 
 def score_trend(close: float, sma50: float, sma200: float) -> int:
@@ -136,11 +192,11 @@ def score_trend(close: float, sma50: float, sma200: float) -> int:
     - Bear market rally (price > SMA50, SMA50 < SMA200)
     - Strong downtrend (price < SMA50 < SMA200)
     """
-    if pd.isna(sma50):
+    if _isnan(sma50):
         return 5  # Not enough data
 
     # If SMA200 is not available, just use SMA50
-    if pd.isna(sma200):
+    if _isnan(sma200):
         if close > sma50:
             return 7
         else:
@@ -169,20 +225,15 @@ def score_bollinger(pctb: float) -> int:
     - Near upper band is NOT automatically bearish (may be breakout)
     - Scores are neutral; requires trend confirmation for interpretation
     """
-    if pd.isna(pctb):
+    # <0: 3 breaking down below bands
+    # <0.2: 5 near lower band (neutral until trend confirms)
+    # <0.5: 6 pullback zone (healthy in uptrend)
+    # <0.8: 6 middle-upper range
+    # <=1.0: 5 approaching upper band
+    # else: 4 extended breakout (may be stretched)
+    if _isnan(pctb):
         return 5
-    if pctb < 0:
-        return 3   # Breaking down below bands
-    elif pctb < 0.2:
-        return 5   # Near lower band (neutral until trend confirms)
-    elif pctb < 0.5:
-        return 6   # Pullback zone - healthy in uptrend
-    elif pctb < 0.8:
-        return 6   # Middle-upper range
-    elif pctb <= 1.0:
-        return 5   # Approaching upper band
-    else:
-        return 4   # Extended breakout - may be stretched
+    return int(BB_SCORES[np.searchsorted(BB_THRESHOLDS, pctb, side="right")])
 
 
 def score_adx(adx: float, plus_di: float, minus_di: float) -> int:
@@ -195,21 +246,17 @@ def score_adx(adx: float, plus_di: float, minus_di: float) -> int:
     Key insight: Low ADX (< 20) means NO TREND - dampens all signals.
     Used as a qualifier for other indicators.
     """
-    if pd.isna(adx):
+    if _isnan(adx):
         return 5
 
-    uptrend = plus_di > minus_di if not (pd.isna(plus_di) or pd.isna(minus_di)) else True
+    uptrend = plus_di > minus_di if not (_isnan(plus_di) or _isnan(minus_di)) else True
 
-    if adx > 30 and uptrend:
-        return 9   # Strong uptrend - high confidence
-    elif adx > 25 and uptrend:
-        return 7   # Moderate uptrend
-    elif adx > 25 and not uptrend:
-        return 2   # Strong downtrend - avoid
-    elif adx >= 20:
-        return 5   # Developing trend
-    else:
-        return 4   # Weak/no trend - dampen all signals
+    # >30: 9 strong uptrend (high confidence) / 2 strong downtrend (avoid)
+    # >25: 7 moderate uptrend / 2 strong downtrend
+    # >=20: 5 developing trend
+    # else: 4 weak/no trend (dampen all signals)
+    table = ADX_UP_SCORES if uptrend else ADX_DN_SCORES
+    return int(table[np.searchsorted(ADX_THRESHOLDS, adx, side="right")])
 
 
 def score_volume(volume_ratio: float, is_up_day: bool) -> int:
@@ -221,32 +268,26 @@ def score_volume(volume_ratio: float, is_up_day: bool) -> int:
     - High volume on down day = distribution (bearish)
     - Normal volume = neutral (no confirmation)
     """
-    if pd.isna(volume_ratio):
+    # >2.0: 9 breakout volume (accumulation) / 2 panic selling (distribution)
+    # >1.5: 7 accumulation / 4 distribution
+    # else: 5 normal or below-average volume - no signal
+    if _isnan(volume_ratio):
         return 5
-
-    if volume_ratio > 2.0:
-        if is_up_day:
-            return 9   # Breakout volume - strong accumulation
-        else:
-            return 2   # Panic selling - distribution
-    elif volume_ratio > 1.5:
-        if is_up_day:
-            return 7   # Accumulation
-        else:
-            return 4   # Distribution
-    elif volume_ratio > 1.0:
-        return 5   # Normal volume
-    else:
-        return 5   # Below average - no signal
+    table = VOL_UP_SCORES if is_up_day else VOL_DN_SCORES
+    return int(table[np.searchsorted(VOL_THRESHOLDS, volume_ratio, side="right")])
 
 
-def compute_technical_indicators(df: pd.DataFrame, weights: dict = None) -> dict:
+def compute_technical_indicators(
+    df: pd.DataFrame, weights: dict = None, weight_vector: tuple[float, ...] | None = None,
+) -> dict:
     """
     Compute all technical indicators for the given OHLCV data.
 
     Args:
         df: DataFrame with OHLCV columns
         weights: Dict mapping indicator names to weights. If None, uses equal weights.
+        weight_vector: `weights` in SCORE_KEYS order, if the caller already has it
+            (see load_technical_weight_vector()).
 
     Returns:
         Dict with indicators, scores, and weighted technical_score.
@@ -259,80 +300,67 @@ def compute_technical_indicators(df: pd.DataFrame, weights: dict = None) -> dict
     if len(df) < 50:
         raise ValueError(f"Not enough data: {len(df)} rows, need at least 50")
 
-    # Make a copy to avoid modifying original
-    df = df.copy()
-
-    # Compute all indicators via shared computation layer
-    ind = compute_all(df)
-    df = ind['df']
-
-    # Map column names for backward compatibility with scoring functions
-    if 'macd_hist' in df.columns:
-        df["macd_histogram"] = df["macd_hist"]
-    if 'vol_sma20' in df.columns:
-        df["volume_sma20"] = df["vol_sma20"]
-    if 'vol_ratio' in df.columns:
-        df["volume_ratio"] = df["vol_ratio"]
-    if 'sma200' not in df.columns:
-        df["sma200"] = pd.Series([float("nan")] * len(df), index=df.index)
-
-    # Get latest values
-    latest = df.iloc[-1]
-    prev = df.iloc[-2] if len(df) > 1 else latest
+    # Latest indicator values in one fused pass over the OHLCV arrays
+    # (no full indicator Series, no df copy)
+    latest = technical_scalars(df)
 
     # Determine if up day
-    is_up_day = latest["Close"] >= latest["Open"]
+    is_up_day = latest["close"] >= latest["open"]
 
     # Build indicators dict with safe value extraction
     def safe_float(val):
-        if pd.isna(val):
+        if _isnan(val):
             return None
         return round(float(val), 4)
 
     indicators = {
-        "rsi": safe_float(latest.get("rsi")),
-        "macd": safe_float(latest.get("macd")),
-        "macd_signal": safe_float(latest.get("macd_signal")),
-        "macd_histogram": safe_float(latest.get("macd_histogram")),
-        "sma50": safe_float(latest.get("sma50")),
-        "sma200": safe_float(latest.get("sma200")),
-        "bollinger_upper": safe_float(latest.get("bb_upper")),
-        "bollinger_middle": safe_float(latest.get("bb_middle")),
-        "bollinger_lower": safe_float(latest.get("bb_lower")),
-        "bollinger_pctb": safe_float(latest.get("bb_pctb")),
-        "adx": safe_float(latest.get("adx")),
-        "plus_di": safe_float(latest.get("plus_di")),
-        "minus_di": safe_float(latest.get("minus_di")),
-        "volume_ratio": safe_float(latest.get("volume_ratio")),
-        "latest_close": safe_float(latest["Close"]),
+        "rsi": safe_float(latest["rsi"]),
+        "macd": safe_float(latest["macd"]),
+        "macd_signal": safe_float(latest["macd_signal"]),
+        "macd_histogram": safe_float(latest["macd_hist"]),
+        "sma50": safe_float(latest["sma50"]),
+        "sma200": safe_float(latest["sma200"]),
+        "bollinger_upper": safe_float(latest["bb_upper"]),
+        "bollinger_middle": safe_float(latest["bb_middle"]),
+        "bollinger_lower": safe_float(latest["bb_lower"]),
+        "bollinger_pctb": safe_float(latest["bb_pctb"]),
+        "adx": safe_float(latest["adx"]),
+        "plus_di": safe_float(latest["plus_di"]),
+        "minus_di": safe_float(latest["minus_di"]),
+        "volume_ratio": safe_float(latest["vol_ratio"]),
+        "latest_close": safe_float(latest["close"]),
     }
 
     # Compute scores
     scores = {
-        "rsi": score_rsi(latest.get("rsi")),
+        "rsi": score_rsi(latest["rsi"]),
         "macd": score_macd(
-            latest.get("macd"),
-            latest.get("macd_signal"),
-            prev.get("macd"),
-            prev.get("macd_signal"),
+            latest["macd"],
+            latest["macd_signal"],
+            latest["macd_prev"],
+            latest["macd_signal_prev"],
         ),
         "trend": score_trend(
-            latest["Close"],
-            latest.get("sma50"),
-            latest.get("sma200"),
+            latest["close"],
+            latest["sma50"],
+            latest["sma200"],
         ),
-        "bollinger": score_bollinger(latest.get("bb_pctb")),
+        "bollinger": score_bollinger(latest["bb_pctb"]),
         "adx": score_adx(
-            latest.get("adx"),
-            latest.get("plus_di"),
-            latest.get("minus_di"),
+            latest["adx"],
+            latest["plus_di"],
+            latest["minus_di"],
         ),
-        "volume": score_volume(latest.get("volume_ratio"), is_up_day),
+        "volume": score_volume(latest["vol_ratio"], is_up_day),
     }
 
     # Calculate overall technical score using weighted average
-    technical_score = sum(scores[ind] * weights[ind] for ind in scores.keys())
-    technical_score = round(technical_score, 1)
+    if weight_vector is None:
+        weight_vector = order_weights(weights)
+    # Sum the products with Python's sum(): it is compensated for floats, and
+    # np.dot / ndarray.sum() reorder the additions, which flips round(.., 1)
+    # on .x5 ties. kernels.score_batch() uses the same compensated sum.
+    technical_score = round(sum(scores[key] * w for key, w in zip(SCORE_KEYS, weight_vector)), 1)
 
     return {
         "indicators": indicators,
@@ -343,46 +371,84 @@ def compute_technical_indicators(df: pd.DataFrame, weights: dict = None) -> dict
     }
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: uv run python scripts/technical_analysis.py <symbol>", file=sys.stderr)
-        sys.exit(1)
-
-    symbol = sys.argv[1]
-    print(f"Computing technical indicators for {symbol}...", file=sys.stderr)
-
-    # Read OHLCV data from parquet
-    base_path = Path(__file__).parent.parent
-    ohlcv_path = base_path / "cache" / "ohlcv" / f"{symbol}.parquet"
-
-    if not ohlcv_path.exists():
-        print(f"Error: OHLCV data not found at {ohlcv_path}", file=sys.stderr)
-        sys.exit(1)
-
+def load_fresh_output(output_path: Path, in_stat, weights: dict) -> dict | None:
+    """Return a saved analysis if it was built from this exact parquet + weights + code."""
+    if not output_path.exists():
+        return None
     try:
-        df = pd.read_parquet(ohlcv_path)
-        print(f"Loaded {len(df)} data points from {ohlcv_path}", file=sys.stderr)
-    except Exception as e:
-        print(f"Error reading parquet file: {e}", file=sys.stderr)
-        sys.exit(1)
-
-    # Ensure required columns exist
-    required_cols = ["Open", "High", "Low", "Close", "Volume"]
-    missing_cols = [col for col in required_cols if col not in df.columns]
-    if missing_cols:
-        print(f"Error: Missing columns: {missing_cols}", file=sys.stderr)
-        sys.exit(1)
+        cached = json.loads(output_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if (
+        cached.get("output_version") != output_version()
+        or cached.get("input_mtime") != in_stat.st_mtime
+        or cached.get("input_size") != in_stat.st_size
+        or cached.get("weights") != {ind: round(weights[ind], 4) for ind in SCORE_KEYS}
+    ):
+        return None
+    return cached
+
+
+def run_for_symbol(
+    symbol: str, weights: dict | None = None, base_path: Path = BASE_PATH, quiet: bool = False,
+    df: pd.DataFrame | None = None, force: bool = False,
+    weight_vector: tuple[float, ...] | None = None,
+) -> dict:
+    """
+    Load cached OHLCV for a symbol, score it, and save data/technical/<symbol>.json.
+
+    Importable entry point for batch runners (no CLI side effects; quiet=True
+    also drops the per-symbol progress lines on stderr). Callers that already
+    hold the symbol's OHLCV frame can pass it as `df` to skip the parquet read,
+    and batch runners pass the ordered `weight_vector` loaded once with `weights`.
+    Unless force=True, a saved result built from the same parquet (mtime +
+    size), weights and output_version() is returned without recomputing.
+    Raises FileNotFoundError / ValueError when the data is missing or unusable.
+    """
+    ohlcv_path = base_path / "cache" / "ohlcv" / f"{symbol}.parquet"
+    output_path = base_path / "data" / "technical" / f"{symbol}.json"
+    in_stat = ohlcv_path.stat() if ohlcv_path.exists() else None
 
-    # Load technical weights from config
-    config_path = base_path / "config" / "technical_weights.csv"
-    weights = load_technical_weights(config_path)
+    if weights is None:
+        config_path = base_path / "config" / "technical_weights.csv"
+        weights = load_technical_weights(config_path)
+        weight_vector = load_technical_weight_vector(config_path)
+
+    if not force and in_stat is not None:
+        cached = load_fresh_output(output_path, in_stat, weights)
+        if cached is not None:
+            if not quiet:
+                print(f"Up to date: {output_path}", file=sys.stderr)
+            return cached
+
+    if df is None:
+        if in_stat is None:
+            raise FileNotFoundError(f"OHLCV data not found at {ohlcv_path}")
+
+        # Check the schema (footer only), then decode just the OHLCV columns —
+        # yfinance caches also carry Dividends/Stock Splits we never use.
+        # One ParquetFile handle serves both; split_blocks/self_destruct hand
+        # each Arrow column to pandas without a consolidation copy.
+        try:
+            pf = pq.ParquetFile(ohlcv_path)
+            available = set(pf.schema_arrow.names)
+            missing_cols = [col for col in OHLCV_COLUMNS if col not in available]
+            if not missing_cols:
+                df = pf.read(columns=OHLCV_COLUMNS, use_pandas_metadata=True).to_pandas(
+                    split_blocks=True, self_destruct=True
+                )
+        except Exception as e:
+            raise ValueError(f"Error reading parquet file: {e}") from e
+        if missing_cols:
+            raise ValueError(f"Missing columns: {missing_cols}")
+        if not quiet:
+            print(f"Loaded {len(df)} data points from {ohlcv_path}", file=sys.stderr)
+    else:
+        missing_cols = [col for col in OHLCV_COLUMNS if col not in df.columns]
+        if missing_cols:
+            raise ValueError(f"Missing columns: {missing_cols}")
 
-    # Compute indicators
-    try:
-        result = compute_technical_indicators(df, weights)
-    except ValueError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
+    result = compute_technical_indicators(df, weights, weight_vector)
 
     # Build output
     output = {
@@ -394,14 +460,38 @@ def main():
         "weights": result["weights"],
         "technical_score": result["technical_score"],
     }
+    if in_stat is not None:
+        output["input_mtime"] = in_stat.st_mtime
+        output["input_size"] = in_stat.st_size
+        output["output_version"] = output_version()
 
     # Save to data/technical/<symbol>.json
-    output_path = base_path / "data" / "technical" / f"{symbol}.json"
-    save_json(output_path, output)
-    print(f"Saved analysis to {output_path}", file=sys.stderr)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_bytes(dumps_output(output))
+    if not quiet:
+        print(f"Saved analysis to {output_path}", file=sys.stderr)
+
+    return output
+
+
+def main():
+    args = [a for a in sys.argv[1:] if a != "--force"]
+    force = len(args) < len(sys.argv) - 1
+    if not args:
+        print("Usage: uv run python scripts/technical_analysis.py <symbol> [--force]", file=sys.stderr)
+        sys.exit(1)
+
+    symbol = args[0]
+    print(f"Computing technical indicators for {symbol}...", file=sys.stderr)
+
+    try:
+        output = run_for_symbol(symbol, force=force)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
 
     # Print JSON to stdout
-    print(json.dumps(output, indent=2))
+    sys.stdout.write(dumps_output(output).decode() + "\n")
 
 
 if __name__ == "__main__":
@@ -8,19 +8,31 @@ agents can safely update the file without breaking downstream consumers.
 Usage:
   uv run python scripts/validate_ipos.py
   uv run python scripts/validate_ipos.py --path data/ipos.json
+
+With VALIDATE_IPOS_CACHE=1, the SHA-256 of the last file that validated is
+kept in cache/validate_ipos.hash and an unchanged file is not re-validated
+(unless this script changed since).
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import os
+import re
 import sys
 from pathlib import Path
 from typing import Any
 
 
+HASH_CACHE = Path(__file__).parent.parent / "cache" / "validate_ipos.hash"
+
 ALLOWED_STATUS = {"UPCOMING", "OPEN", "CLOSED", "LISTED", "WITHDRAWN", "CANCELLED"}
 
+# Very light check: YYYY-MM-DD
+_ISO_DATE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}").fullmatch
+
 
 def fail(msg: str) -> None:
     print(f"Error: {msg}", file=sys.stderr)
@@ -32,11 +44,7 @@ def is_iso_date(s: Any) -> bool:
         return True
     if not isinstance(s, str):
         return False
-    # Very light check: YYYY-MM-DD
-    parts = s.split("-")
-    if len(parts) != 3:
-        return False
-    return all(p.isdigit() for p in parts) and len(parts[0]) == 4 and len(parts[1]) == 2 and len(parts[2]) == 2
+    return _ISO_DATE(s) is not None
 
 
 def validate_root(doc: dict[str, Any]) -> None:
@@ -136,8 +144,19 @@ def main() -> None:
     if not path.exists():
         fail(f"File not found: {path}")
 
+    raw = path.read_bytes()
+    use_cache = os.environ.get("VALIDATE_IPOS_CACHE") == "1"
+    if use_cache:
+        # Keyed by path and by this validator's source too, so another file
+        # or edited validation rules never reuse this hash
+        rules = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+        digest = f"{hashlib.sha256(raw).hexdigest()} {rules} {path.resolve()}"
+        if HASH_CACHE.exists() and HASH_CACHE.read_text(encoding="utf-8") == digest:
+            print(f"OK (cached): {path}")
+            return
+
     try:
-        doc = json.loads(path.read_text(encoding="utf-8"))
+        doc = json.loads(raw.decode("utf-8"))
     except Exception as e:
         fail(f"Invalid JSON: {e}")
 
@@ -154,6 +173,9 @@ def main() -> None:
         validate_ipo(ipo, idx, file_revision=file_revision)
 
     validate_unique_ids(ipos)
+    if use_cache:
+        HASH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        HASH_CACHE.write_text(digest, encoding="utf-8")
     print(f"OK: {path} (ipos: {len(ipos)}, file_revision: {file_revision})")
 
 
@@ -10,21 +10,29 @@ Usage:
   uv run python scripts/validate_scan.py latest
   uv run python scripts/validate_scan.py data/scans/scan_YYYYMMDD_HHMMSS.json
   uv run python scripts/validate_scan.py latest --output data/scans/scan_validated.json
+  uv run python scripts/validate_scan.py latest --workers 1
 """
 
 from __future__ import annotations
 
 import argparse
+import heapq
 import importlib.util
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from types import ModuleType
 from typing import Any
 
+import numpy as np
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from utils.data import latest_scan_file
 from utils.helpers import normalize_symbol
 from utils.config import SCAN_SETUP_RULES
 
@@ -91,16 +99,8 @@ def score_2m_pullback(analysis: dict[str, Any]) -> dict[str, Any]:
     score = 0
 
     # +25 trend_ok: close > sma200 AND (sma50 >= sma200 OR close > sma50)
-    trend_ok = False
-    if sma50 is not None and sma200 is not None:
-        if sma50 >= sma200 or price > sma50:
-            trend_ok = True
-    elif sma50 is not None and price > sma50:
-        trend_ok = True
-    elif price > sma200:
-        trend_ok = True
-
-    if trend_ok:
+    # (close > sma200 is already guaranteed by hard gate 1)
+    if sma50 is None or sma50 >= sma200 or price > sma50:
         score += 25
         result["why"].append("trend_ok")
 
@@ -202,15 +202,12 @@ def score_2w_breakout(analysis: dict[str, Any]) -> dict[str, Any]:
 
     score = 0
 
-    # +25 trend_ok
-    trend_ok = False
+    # +25 trend_ok: close > sma50 >= sma200. With only one SMA available,
+    # hard gate 1 already guaranteed close is above it.
     if sma50 is not None and sma200 is not None:
-        if price > sma50 and sma50 >= sma200:
-            trend_ok = True
-    elif sma50 is not None and price > sma50:
-        trend_ok = True
-    elif sma200 is not None and price > sma200:
-        trend_ok = True
+        trend_ok = price > sma50 and sma50 >= sma200
+    else:
+        trend_ok = sma50 is not None or sma200 is not None
 
     if trend_ok:
         score += 25
@@ -374,48 +371,42 @@ def compute_rankings(
     - Sort by score desc, then volume_ratio desc, then pct_from_sma20 asc, then symbol asc
     - Keep top N
     """
-    rankings = {
+    # One pass over the symbols fills every bucket with sort-key tuples:
+    # (-score, -volume_ratio, pct_from_sma20, symbol, why, scan_hits).
+    # Symbols are unique per bucket, so tuple comparison never reaches why.
+    buckets: dict[str, list[tuple]] = {
         "2w_breakout": [],
         "2m_pullback": [],
         "support_reversal": [],
     }
 
-    for setup_type in rankings.keys():
-        candidates = []
-
-        for symbol, setups in setups_by_symbol.items():
+    for symbol, setups in setups_by_symbol.items():
+        analysis = None
+        for setup_type, bucket in buckets.items():
             setup = setups.get(setup_type, {})
             if not setup.get("pass"):
                 continue
 
-            analysis = results_by_symbol.get(symbol, {})
-            volume_ratio = analysis.get("volume_ratio", 1.0)
-            pct_from_sma20 = analysis.get("pct_from_sma20", 0) or 0
+            if analysis is None:
+                analysis = results_by_symbol.get(symbol, {})
+                volume_ratio = analysis.get("volume_ratio", 1.0)
+                pct_from_sma20 = analysis.get("pct_from_sma20", 0) or 0
+                scan_hits = scan_hits_by_symbol.get(symbol, [])
 
             # Compile why string
             why_list = setup.get("why", [])
             why_str = " + ".join(why_list[:4]) if why_list else ""
 
-            candidates.append({
-                "symbol": symbol,
-                "score": setup.get("score", 0),
-                "why": why_str,
-                "scan_hits": scan_hits_by_symbol.get(symbol, []),
-                # For sorting
-                "_volume_ratio": volume_ratio,
-                "_pct_from_sma20": pct_from_sma20,
-            })
-
-        # Sort: score desc, volume_ratio desc, pct_from_sma20 asc (less chase), symbol asc
-        candidates.sort(
-            key=lambda x: (-x["score"], -x["_volume_ratio"], x["_pct_from_sma20"], x["symbol"])
-        )
-
-        # Keep top N and remove sort keys
-        for c in candidates[:top_n]:
-            del c["_volume_ratio"]
-            del c["_pct_from_sma20"]
-            rankings[setup_type].append(c)
+            bucket.append((-setup.get("score", 0), -volume_ratio, pct_from_sma20, symbol, why_str, scan_hits))
+
+    # Top N by score desc, volume_ratio desc, pct_from_sma20 asc (less chase),
+    # symbol asc — a bounded heap instead of sorting every candidate
+    rankings: dict[str, list[dict[str, Any]]] = {}
+    for setup_type, bucket in buckets.items():
+        rankings[setup_type] = [
+            {"symbol": symbol, "score": -neg_score, "why": why_str, "scan_hits": scan_hits}
+            for neg_score, _, _, symbol, why_str, scan_hits in heapq.nsmallest(top_n, bucket)
+        ]
 
     return rankings
 
@@ -435,27 +426,26 @@ class ValidationRuleSet:
 def find_latest_scan_file() -> Path:
     if not SCANS_DIR.exists():
         raise FileNotFoundError("data/scans does not exist (no scan files found)")
-    scans = sorted(SCANS_DIR.glob("scan_*.json"), reverse=True)
-    if not scans:
+    latest = latest_scan_file(SCANS_DIR)
+    if latest is None:
         raise FileNotFoundError("No scan files found in data/scans/")
-    return scans[0]
+    return latest
 
 
 def load_json(path: Path) -> dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
+    # Parse straight from bytes (no intermediate str)
+    return json.loads(path.read_bytes())
+
+
+_NUMPY_SCALAR_TYPES = (np.bool_, np.integer, np.floating)
 
 
 def _json_serializer(obj):
     """Handle numpy types and other non-serializable objects."""
-    import numpy as np
-    if isinstance(obj, (np.bool_, bool)):
-        return bool(obj)
-    if isinstance(obj, (np.integer, int)):
-        return int(obj)
-    if isinstance(obj, (np.floating, float)):
-        return float(obj)
     if isinstance(obj, np.ndarray):
         return obj.tolist()
+    if isinstance(obj, _NUMPY_SCALAR_TYPES):
+        return obj.item()  # Matching Python bool/int/float in one call
     return str(obj)
 
 
@@ -464,17 +454,88 @@ def save_json(path: Path, data: dict[str, Any]) -> None:
     path.write_text(json.dumps(data, indent=2, ensure_ascii=False, default=_json_serializer), encoding="utf-8")
 
 
-def load_verify_scan_module():
-    """Import scripts/verify_scan.py as a module without turning scripts/ into a package."""
-    verify_path = Path(__file__).parent / "verify_scan.py"
-    spec = importlib.util.spec_from_file_location("verify_scan", verify_path)
+_sibling_modules: dict[str, ModuleType] = {}
+
+
+def _load_sibling_module(name: str) -> ModuleType:
+    """Import scripts/<name>.py once per process and register it in sys.modules."""
+    module = _sibling_modules.get(name)
+    if module is not None:
+        return module
+    spec = importlib.util.spec_from_file_location(name, Path(__file__).parent / f"{name}.py")
     if spec is None or spec.loader is None:
-        raise RuntimeError("Could not load verify_scan module spec")
+        raise RuntimeError(f"Could not load {name} module spec")
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)
+    _sibling_modules[name] = module
+    sys.modules[name] = module
     return module
 
 
+def load_verify_scan_module() -> ModuleType:
+    """Import scripts/verify_scan.py as a module without turning scripts/ into a package."""
+    return _load_sibling_module("verify_scan")
+
+
+def load_technical_all_module() -> ModuleType:
+    """Import scripts/technical_all.py (TA script table + in-process loader)."""
+    # Cached so its own per-process script cache survives across symbols
+    return _load_sibling_module("technical_all")
+
+
+def run_scan_ta(symbol: str) -> None:
+    """
+    Run the modular TA scripts (StochRSI, divergence, patterns, entry_points)
+    for one scan symbol in-process.
+
+    Saves to data/scan_technical/<symbol>_<name>.json for dashboard + agent use,
+    plus data/ta/ as the scripts' own CLI does. Failures are non-fatal.
+    """
+    from utils.data import save_scan_ta, save_ta
+    from utils.ta_common import load_ohlcv
+
+    try:
+        df = load_ohlcv(symbol.upper())
+    except (FileNotFoundError, ValueError):
+        return
+
+    technical_all = load_technical_all_module()
+    for name, rel_path, func_name in technical_all.TA_SCRIPTS:
+        try:
+            analyze = getattr(technical_all.load_script_module(name, rel_path), func_name)
+            result = analyze(df)
+            save_ta(symbol, name, result)
+            save_scan_ta(symbol, name, result)
+        except Exception:
+            pass  # Non-fatal — scan validation still completes
+
+
+def _normalize_match_dict(match: dict[str, Any]) -> dict[str, Any]:
+    out = dict(match)
+    out["symbol"] = str(match.get("symbol", "")).strip()
+    return out
+
+
+def _normalize_match_str(match: str) -> dict[str, Any]:
+    raw = match.strip()
+    if " - " in raw:
+        # Strip each part once; empty parts are dropped before indexing
+        parts = [p for p in map(str.strip, raw.split(" - ")) if p]
+        n = len(parts)
+        return {
+            "symbol": parts[0] if n else "",
+            "note": parts[1] if n >= 2 else "",
+            "source": parts[2] if n >= 3 else "",
+            "raw": raw,
+        }
+
+    first = raw.split(None, 1)[0] if raw else ""
+    return {"symbol": first, "raw": raw}
+
+
+_MATCH_NORMALIZERS = {dict: _normalize_match_dict, str: _normalize_match_str}
+
+
 def normalize_match(match: Any) -> dict[str, Any]:
     """
     Normalize a match entry into a dict with at least `symbol`.
@@ -484,24 +545,14 @@ def normalize_match(match: Any) -> dict[str, Any]:
     - "SYMBOL - note - source"
     - "SYMBOL ..."
     """
+    fn = _MATCH_NORMALIZERS.get(type(match))
+    if fn is not None:
+        return fn(match)
+    # Subclasses (e.g. OrderedDict) miss the exact-type lookup above
     if isinstance(match, dict):
-        symbol = str(match.get("symbol", "")).strip()
-        out = dict(match)
-        out["symbol"] = symbol
-        return out
-
+        return _normalize_match_dict(match)
     if isinstance(match, str):
-        raw = match.strip()
-        if " - " in raw:
-            parts = [p.strip() for p in raw.split(" - ") if p.strip()]
-            symbol = parts[0] if parts else ""
-            note = parts[1] if len(parts) >= 2 else ""
-            source = parts[2] if len(parts) >= 3 else ""
-            return {"symbol": symbol, "note": note, "source": source, "raw": raw}
-
-        first = raw.split()[0] if raw else ""
-        return {"symbol": first, "raw": raw}
-
+        return _normalize_match_str(match)
     return {"symbol": "", "raw": str(match)}
 
 
@@ -518,9 +569,9 @@ def extract_symbols(scan_data: dict[str, Any], max_per_scan: int | None = None)
         elif isinstance(scan_block, list):
             matches = scan_block
 
-        normalized_matches = [normalize_match(m) for m in matches]
         if max_per_scan is not None:
-            normalized_matches = normalized_matches[: max_per_scan]
+            matches = matches[: max_per_scan]
+        normalized_matches = [normalize_match(m) for m in matches]
         normalized_scans[str(scan_type)] = normalized_matches
 
         for m in normalized_matches:
@@ -534,99 +585,116 @@ def extract_symbols(scan_data: dict[str, Any], max_per_scan: int | None = None)
     return symbols, normalized_scans
 
 
+def _validate_rsi(metrics: dict[str, Any], rules: ValidationRuleSet) -> dict[str, Any]:
+    # Best practice: oversold OR recovering within an uptrend with bullish momentum
+    rsi = metrics["rsi"]
+    if isinstance(rsi, (int, float)) and rsi <= rules.rsi_oversold_max:
+        return {"pass": True, "reason": f"rsi<= {rules.rsi_oversold_max}", "metrics": metrics}
+    if (
+        isinstance(rsi, (int, float))
+        and rsi <= rules.rsi_recovery_max
+        and metrics["trend"] in {"UP", "STRONG UP"}
+        and metrics["macd_bullish"]
+    ):
+        return {"pass": True, "reason": "oversold_recovery_in_uptrend", "metrics": metrics}
+    return {"pass": False, "reason": "rsi_not_oversold", "metrics": metrics}
+
+
+def _validate_macd(metrics: dict[str, Any], rules: ValidationRuleSet) -> dict[str, Any]:
+    # Screeners typically mean a *recent* crossover, not just MACD>signal.
+    macd_crossover_days_ago = metrics["macd_crossover_days_ago"]
+    if not metrics["macd_bullish"]:
+        return {"pass": False, "reason": "macd_not_bullish", "metrics": metrics}
+    if isinstance(macd_crossover_days_ago, int) and macd_crossover_days_ago <= rules.macd_crossover_max_days:
+        return {"pass": True, "reason": "recent_macd_crossover", "metrics": metrics}
+    if macd_crossover_days_ago is None:
+        # If crossover recency can't be computed, fall back to bullish MACD.
+        return {"pass": True, "reason": "macd_bullish_no_recency", "metrics": metrics}
+    return {"pass": False, "reason": "macd_crossover_not_recent", "metrics": metrics}
+
+
+def _validate_golden_cross(metrics: dict[str, Any], rules: ValidationRuleSet) -> dict[str, Any]:
+    golden_cross_days_ago = metrics["golden_cross_days_ago"]
+    if not metrics["golden_cross"]:
+        return {"pass": False, "reason": "no_golden_cross", "metrics": metrics}
+    if isinstance(golden_cross_days_ago, int) and golden_cross_days_ago <= rules.golden_cross_max_days:
+        return {"pass": True, "reason": "recent_golden_cross", "metrics": metrics}
+    if golden_cross_days_ago is None:
+        return {"pass": True, "reason": "golden_cross_no_recency", "metrics": metrics}
+    return {"pass": True, "reason": "golden_cross_older", "metrics": metrics}
+
+
+def _validate_volume(metrics: dict[str, Any], rules: ValidationRuleSet) -> dict[str, Any]:
+    volume_ratio = metrics["volume_ratio"]
+    price_change_1d = metrics["price_change_1d"]
+    vol_ok = isinstance(volume_ratio, (int, float)) and volume_ratio >= rules.volume_breakout_min_ratio
+    price_ok = isinstance(price_change_1d, (int, float)) and price_change_1d > 0
+    passed = bool(vol_ok and price_ok)
+    reason = "volume_and_price_breakout" if passed else "no_volume_breakout"
+    return {"pass": passed, "reason": reason, "metrics": metrics}
+
+
+def _validate_52w_high(metrics: dict[str, Any], rules: ValidationRuleSet) -> dict[str, Any]:
+    pct_from_high = metrics["pct_from_high"]
+    near_high = isinstance(pct_from_high, (int, float)) and pct_from_high <= rules.week52_high_max_pct_off
+    passed = bool(near_high and metrics["trend"] in {"UP", "STRONG UP"})
+    reason = "near_52w_high" if passed else "not_near_52w_high"
+    return {"pass": passed, "reason": reason, "metrics": metrics}
+
+
+# Normalized scan type -> validator
+SCAN_TYPE_VALIDATORS = {
+    "rsi_oversold": _validate_rsi,
+    "rsi": _validate_rsi,
+    "macd_crossover": _validate_macd,
+    "macd": _validate_macd,
+    "golden_cross": _validate_golden_cross,
+    "volume_breakout": _validate_volume,
+    "volume": _validate_volume,
+    "52week_high": _validate_52w_high,
+    "52_week_high": _validate_52w_high,
+    "week52_high": _validate_52w_high,
+}
+
+
 def validate_for_scan_type(scan_type: str, analysis: dict[str, Any] | None, rules: ValidationRuleSet) -> dict[str, Any]:
     """Return a compact validation result for a given scan type."""
     if analysis is None:
         return {"pass": False, "reason": "no_ohlcv_data"}
 
-    rsi = analysis.get("rsi")
-    macd_bullish = bool(analysis.get("macd_bullish"))
-    macd_crossover_days_ago = analysis.get("macd_crossover_days_ago")
-    trend = analysis.get("trend")
-    golden_cross = analysis.get("golden_cross")
-    golden_cross_days_ago = analysis.get("golden_cross_days_ago")
-    volume_ratio = analysis.get("volume_ratio")
-    price_change_1d = analysis.get("price_change_1d")
-    pct_from_high = analysis.get("pct_from_high")
-
     metrics = {
         "yf_symbol": analysis.get("yf_symbol"),
         "technical_score": analysis.get("technical_score"),
         "recommendation": analysis.get("recommendation"),
-        "rsi": rsi,
-        "macd_bullish": macd_bullish,
-        "macd_crossover_days_ago": macd_crossover_days_ago,
-        "trend": trend,
-        "golden_cross": golden_cross,
-        "golden_cross_days_ago": golden_cross_days_ago,
-        "volume_ratio": volume_ratio,
-        "price_change_1d": price_change_1d,
-        "pct_from_high": pct_from_high,
+        "rsi": analysis.get("rsi"),
+        "macd_bullish": bool(analysis.get("macd_bullish")),
+        "macd_crossover_days_ago": analysis.get("macd_crossover_days_ago"),
+        "trend": analysis.get("trend"),
+        "golden_cross": analysis.get("golden_cross"),
+        "golden_cross_days_ago": analysis.get("golden_cross_days_ago"),
+        "volume_ratio": analysis.get("volume_ratio"),
+        "price_change_1d": analysis.get("price_change_1d"),
+        "pct_from_high": analysis.get("pct_from_high"),
     }
 
-    scan_type_norm = scan_type.lower().strip()
-    if scan_type_norm in {"rsi_oversold", "rsi"}:
-        # Best practice: oversold OR recovering within an uptrend with bullish momentum
-        if isinstance(rsi, (int, float)) and rsi <= rules.rsi_oversold_max:
-            return {"pass": True, "reason": f"rsi<= {rules.rsi_oversold_max}", "metrics": metrics}
-        if (
-            isinstance(rsi, (int, float))
-            and rsi <= rules.rsi_recovery_max
-            and trend in {"UP", "STRONG UP"}
-            and macd_bullish
-        ):
-            return {"pass": True, "reason": "oversold_recovery_in_uptrend", "metrics": metrics}
-        return {"pass": False, "reason": "rsi_not_oversold", "metrics": metrics}
-
-    if scan_type_norm in {"macd_crossover", "macd"}:
-        # Screeners typically mean a *recent* crossover, not just MACD>signal.
-        if not macd_bullish:
-            return {"pass": False, "reason": "macd_not_bullish", "metrics": metrics}
-        if isinstance(macd_crossover_days_ago, int) and macd_crossover_days_ago <= rules.macd_crossover_max_days:
-            return {"pass": True, "reason": "recent_macd_crossover", "metrics": metrics}
-        if macd_crossover_days_ago is None:
-            # If crossover recency can't be computed, fall back to bullish MACD.
-            return {"pass": True, "reason": "macd_bullish_no_recency", "metrics": metrics}
-        return {"pass": False, "reason": "macd_crossover_not_recent", "metrics": metrics}
-
-    if scan_type_norm in {"golden_cross"}:
-        if not golden_cross:
-            return {"pass": False, "reason": "no_golden_cross", "metrics": metrics}
-        if isinstance(golden_cross_days_ago, int) and golden_cross_days_ago <= rules.golden_cross_max_days:
-            return {"pass": True, "reason": "recent_golden_cross", "metrics": metrics}
-        if golden_cross_days_ago is None:
-            return {"pass": True, "reason": "golden_cross_no_recency", "metrics": metrics}
-        return {"pass": True, "reason": "golden_cross_older", "metrics": metrics}
-
-    if scan_type_norm in {"volume_breakout", "volume"}:
-        vol_ok = isinstance(volume_ratio, (int, float)) and volume_ratio >= rules.volume_breakout_min_ratio
-        price_ok = isinstance(price_change_1d, (int, float)) and price_change_1d > 0
-        passed = bool(vol_ok and price_ok)
-        reason = "volume_and_price_breakout" if passed else "no_volume_breakout"
-        return {"pass": passed, "reason": reason, "metrics": metrics}
-
-    if scan_type_norm in {"52week_high", "52_week_high", "week52_high"}:
-        near_high = isinstance(pct_from_high, (int, float)) and pct_from_high <= rules.week52_high_max_pct_off
-        passed = bool(near_high and trend in {"UP", "STRONG UP"})
-        reason = "near_52w_high" if passed else "not_near_52w_high"
-        return {"pass": passed, "reason": reason, "metrics": metrics}
-
-    # Unknown scan type: just attach metrics
-    return {"pass": False, "reason": "unknown_scan_type", "metrics": metrics}
+    validator = SCAN_TYPE_VALIDATORS.get(scan_type.lower().strip())
+    if validator is None:
+        # Unknown scan type: just attach metrics
+        return {"pass": False, "reason": "unknown_scan_type", "metrics": metrics}
+    return validator(metrics, rules)
 
 
 def build_scan_hits_by_symbol(normalized_scans: dict[str, list[dict[str, Any]]]) -> dict[str, list[str]]:
     """Build a mapping of symbol -> list of scan types it appeared in."""
-    scan_hits: dict[str, list[str]] = {}
+    # Dicts as insertion-ordered sets: O(1) dedup, scan types keep first-seen order
+    scan_hits: dict[str, dict[str, None]] = {}
+    normalize = normalize_symbol
     for scan_type, matches in normalized_scans.items():
         for m in matches:
-            sym = normalize_symbol(str(m.get("symbol", "")).strip())
+            sym = normalize(str(m.get("symbol", "")).strip())
             if sym:
-                if sym not in scan_hits:
-                    scan_hits[sym] = []
-                if scan_type not in scan_hits[sym]:
-                    scan_hits[sym].append(scan_type)
-    return scan_hits
+                scan_hits.setdefault(sym, {})[scan_type] = None
+    return {sym: list(types) for sym, types in scan_hits.items()}
 
 
 def main() -> int:
@@ -644,6 +712,7 @@ def main() -> int:
     parser.add_argument("--rank", action="store_true", help="Write ranked shortlists into validation.rankings (requires --enrich-setups)")
     parser.add_argument("--top", type=int, default=10, help="Shortlist length per ranking bucket (default: 10)")
     parser.add_argument("--us", action="store_true", help="Treat symbols as US stocks (no .NS suffix)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Parallel worker processes for the modular TA scripts (default: CPU count)")
     args = parser.parse_args()
 
     scan_path = Path(args.scan) if args.scan != "latest" else find_latest_scan_file()
@@ -663,32 +732,25 @@ def main() -> int:
     # Run OHLCV-based verification (reuses existing verify_scan implementation)
     verify_scan = load_verify_scan_module()
     results = verify_scan.analyze_batch(symbols, us_market=args.us, verbose=False)
-    results_by_symbol: dict[str, dict[str, Any]] = {r.get("symbol"): r for r in results if isinstance(r, dict)}
-
-    # Run modular TA scripts (StochRSI, divergence, patterns, entry_points)
-    # Saves to data/scan_technical/<symbol>_<name>.json for dashboard + agent use
-    TA_SCRIPTS = [
-        ("stoch_rsi",   "scripts/ta/stoch_rsi.py"),
-        ("divergence",  "scripts/ta/divergence.py"),
-        ("patterns",    "scripts/ta/patterns.py"),
-        ("entry_points","scripts/ta/entry_points.py"),
-    ]
-    scan_ta_dir = Path(__file__).parent.parent / "data" / "scan_technical"
-    scan_ta_dir.mkdir(parents=True, exist_ok=True)
-    import subprocess as _subprocess
-    for sym in results_by_symbol:
-        for name, script in TA_SCRIPTS:
-            try:
-                r = _subprocess.run(
-                    ["uv", "run", "python", script, sym],
-                    capture_output=True, text=True,
-                    cwd=Path(__file__).parent.parent, timeout=30
-                )
-                if r.returncode == 0 and r.stdout.strip():
-                    out = scan_ta_dir / f"{sym}_{name}.json"
-                    out.write_text(r.stdout.strip(), encoding="utf-8")
-            except Exception:
-                pass  # Non-fatal — scan validation still completes
+    # Results without a usable symbol are dropped here, so downstream code
+    # (including the sorted symbols_validated list) only sees str keys
+    results_by_symbol: dict[str, dict[str, Any]] = {}
+    for r in results:
+        if isinstance(r, dict):
+            sym = r.get("symbol")
+            if isinstance(sym, str) and sym:
+                results_by_symbol[sym] = r
+
+    # Run modular TA scripts in-process, one symbol per worker (CPU-bound,
+    # independent across symbols)
+    ta_symbols = list(results_by_symbol)
+    if ta_symbols:
+        # Compile the numba kernels once here so forked workers inherit them
+        from utils.kernels import warmup
+        warmup()
+        workers = max(1, min(args.workers, len(ta_symbols)))
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            list(ex.map(run_scan_ta, ta_symbols))
 
     rules = ValidationRuleSet()
 
@@ -716,7 +778,7 @@ def main() -> int:
     # Determine engine version
     engine_version = 2 if args.enrich_setups else 1
 
-    scan_data["validated_at"] = datetime.now().isoformat()
+    scan_data["validated_at"] = datetime.now().isoformat(timespec="seconds")
     scan_data["validation"] = {
         "engine": "scripts/validate_scan.py",
         "engine_version": engine_version,
@@ -9,35 +9,36 @@ Usage:
 Features:
     - Runs FULL technical analysis (RSI, MACD, SMA, Bollinger, ADX, Volume)
     - Uses cached OHLCV when fresh (<18 hours)
-    - Batches requests (5 at a time, 2s delay)
+    - Batches requests (5 at a time, one bulk download per batch, 2s delay)
     - Exponential backoff on failures (2s, 4s, 8s)
     - Shows comprehensive results for informed decisions
 """
 
 import sys
+import functools
 import json
 import time
 import math
+import random
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime, timedelta
 
+import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-try:
-    import pandas_ta as ta
-    HAS_PANDAS_TA = True
-except ImportError:
-    HAS_PANDAS_TA = False
-
 try:
     import yfinance as yf
     HAS_YFINANCE = True
 except ImportError:
     HAS_YFINANCE = False
 
+from utils import kernels
 from utils.helpers import load_json, save_json
 from utils.config import THRESHOLDS, SCAN_SETUP_RULES
 
@@ -48,6 +49,10 @@ MAX_RETRIES = 3             # Retry failed fetches
 BASE_WAIT_SECONDS = 2       # Base wait for exponential backoff: 2s, 4s, 8s
 CACHE_FRESHNESS_HOURS = 18
 
+# The only columns analysis reads; yfinance frames also carry
+# Dividends/Stock Splits, which are neither decoded nor cached
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
 # Paths
 CACHE_DIR = Path(__file__).parent.parent / "cache" / "ohlcv"
 CACHE_METADATA_PATH = Path(__file__).parent.parent / "cache" / "cache_metadata.json"
@@ -82,38 +87,50 @@ def display_symbol(yf_symbol: str) -> str:
     return yf_symbol.replace(".NS", "").replace(".BO", "")
 
 
-def compute_pivot_lows(df: pd.DataFrame, lookback: int = 90, k: int = 2) -> list[tuple[int, float]]:
+def sma_last(close: np.ndarray, length: int) -> float | None:
+    """Latest `length`-bar mean of close, or None without enough data.
+
+    Like pandas rolling().mean(), an all-equal window returns that price
+    exactly — summation noise would otherwise decide close-vs-SMA trend
+    calls on suspended stocks.
+    """
+    if len(close) < length:
+        return None
+    window = close[-length:]
+    if (window == window[-1]).all():
+        return safe_float(window[-1])
+    return safe_float(kernels.sma_tail(close, length))
+
+
+def compute_pivot_lows(low: np.ndarray, lookback: int = 90, k: int = 2) -> list[tuple[int, float]]:
     """
     Find pivot lows using a simple k-bar window.
 
     A pivot low at index i exists if Low[i] is the minimum of Low[i-k : i+k+1].
 
     Args:
-        df: DataFrame with 'Low' column
+        low: Float64 array of daily lows
         lookback: Number of days to look back from the end
         k: Window size (5-bar pivot uses k=2)
 
     Returns:
         List of (index, low_value) tuples for pivot lows
     """
-    if len(df) < 2 * k + 1:
+    start_idx = max(0, len(low) - lookback)
+    lows = low[start_idx:]
+    if len(lows) < 2 * k + 1:
         return []
 
-    lows = df['Low'].values
-    start_idx = max(0, len(df) - lookback)
-    pivots = []
-
-    for i in range(start_idx + k, len(df) - k):
-        window_start = i - k
-        window_end = i + k + 1
-        window = lows[window_start:window_end]
-        if lows[i] == window.min():
-            pivots.append((i, float(lows[i])))
+    # Row j is the window centred on bar start_idx + k + j. Compare against
+    # the window minimum (not argmin) so ties still count as pivots, and a
+    # NaN anywhere in the window rules it out as before.
+    centers = lows[k:len(lows) - k]
+    is_pivot = centers == sliding_window_view(lows, 2 * k + 1).min(axis=1)
+    positions = np.flatnonzero(is_pivot)
+    return list(zip((positions + start_idx + k).tolist(), centers[positions].tolist()))
 
-    return pivots
 
-
-def compute_support_level(df: pd.DataFrame, current_close: float, lookback: int = 90, k: int = 2) -> float | None:
+def compute_support_level(low: np.ndarray, current_close: float, lookback: int = 90, k: int = 2) -> float | None:
     """
     Find nearest meaningful support below current price.
 
@@ -121,7 +138,7 @@ def compute_support_level(df: pd.DataFrame, current_close: float, lookback: int
     pivot low below current close (nearest support).
 
     Args:
-        df: DataFrame with 'Low' column
+        low: Float64 array of daily lows
         current_close: Current closing price
         lookback: Days to look back for pivots
         k: Pivot window size
@@ -129,7 +146,7 @@ def compute_support_level(df: pd.DataFrame, current_close: float, lookback: int
     Returns:
         Support level or None if no support found
     """
-    pivots = compute_pivot_lows(df, lookback, k)
+    pivots = compute_pivot_lows(low, lookback, k)
 
     # Filter to pivots below current price
     supports_below = [p[1] for p in pivots if p[1] < current_close]
@@ -139,20 +156,22 @@ def compute_support_level(df: pd.DataFrame, current_close: float, lookback: int
         return max(supports_below)
 
     # Fallback: rolling min low over lookback period
-    if len(df) >= lookback:
-        rolling_min = df['Low'].iloc[-lookback:].min()
+    if len(low) >= lookback:
+        # fmin skips NaN like Series.min()
+        rolling_min = np.fmin.reduce(low[-lookback:])
         if rolling_min < current_close:
             return float(rolling_min)
 
     return None
 
 
-def compute_donchian_breakout(df: pd.DataFrame, window: int = 20) -> dict:
+def compute_donchian_breakout(high: np.ndarray, close: np.ndarray, window: int = 20) -> dict:
     """
     Compute Donchian channel breakout metrics.
 
     Args:
-        df: DataFrame with 'High', 'Close' columns
+        high: Float64 array of daily highs
+        close: Float64 array of daily closes
         window: Donchian channel period
 
     Returns:
@@ -164,44 +183,40 @@ def compute_donchian_breakout(df: pd.DataFrame, window: int = 20) -> dict:
         "days_since_breakout_20": None,
     }
 
-    if len(df) < window + 1:
+    n = len(close)
+    if n < window + 1:
         return result
 
-    # Donchian high: max of previous 'window' days' highs (excluding today)
-    # shift(1) excludes current bar
-    donchian_high = df['High'].shift(1).rolling(window).max().iloc[-1]
+    # Donchian high: max of previous 'window' days' highs (excluding today).
+    # Only the latest value is needed, so take it from that window directly
+    # (NaN if any high in it is missing, as rolling().max() gives)
+    donchian_high = high[-window - 1:-1].max()
     result["donchian_high_20"] = safe_float(donchian_high)
 
-    current_close = df['Close'].iloc[-1]
+    current_close = close[-1]
     if result["donchian_high_20"] is not None:
         result["breakout_today"] = current_close > result["donchian_high_20"]
 
-    # Find days since last breakout (within last ~30 days)
-    lookback = min(30, len(df) - window - 1)
+    # Find days since last breakout (within last ~30 days): each of the last
+    # `lookback` closes against the max high of the `window` bars before it
+    # (NaN-skipping, so a missing high doesn't hide a breakout), all at once
+    lookback = min(30, n - window - 1)
     if lookback > 0:
-        for days_ago in range(lookback):
-            idx = -(days_ago + 1)
-            if idx - 1 < -len(df):
-                break
-            close_then = df['Close'].iloc[idx]
-            # Donchian high as of that day
-            donch_idx = idx - 1
-            if abs(donch_idx) + window > len(df):
-                continue
-            donch_high_then = df['High'].iloc[donch_idx - window + 1:donch_idx + 1].max()
-            if close_then > donch_high_then:
-                result["days_since_breakout_20"] = days_ago
-                break
+        prior_highs = sliding_window_view(high[n - lookback - window:n - 1], window)
+        breakouts = np.flatnonzero(close[n - lookback:] > np.fmax.reduce(prior_highs, axis=1))
+        if breakouts.size:
+            result["days_since_breakout_20"] = int(lookback - 1 - breakouts[-1])
 
     return result
 
 
-def compute_tight_range(df: pd.DataFrame, window: int = 10, max_pct: float = 8.0) -> dict:
+def compute_tight_range(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                        window: int = 10, max_pct: float = 8.0) -> dict:
     """
     Compute tight range / compression detection.
 
     Args:
-        df: DataFrame with 'High', 'Low', 'Close' columns
+        high, low, close: Float64 arrays of daily highs, lows and closes
         window: Number of days to check
         max_pct: Maximum range percentage to be considered "tight"
 
@@ -210,13 +225,13 @@ def compute_tight_range(df: pd.DataFrame, window: int = 10, max_pct: float = 8.0
     """
     result = {"range_pct": None, "tight_range": False}
 
-    if len(df) < window:
+    if len(close) < window:
         return result
 
-    recent = df.iloc[-window:]
-    high_max = recent['High'].max()
-    low_min = recent['Low'].min()
-    current_close = df['Close'].iloc[-1]
+    # fmax/fmin skip NaN like Series.max()/min()
+    high_max = np.fmax.reduce(high[-window:])
+    low_min = np.fmin.reduce(low[-window:])
+    current_close = close[-1]
 
     if current_close > 0:
         range_pct = (high_max - low_min) / current_close * 100
@@ -226,12 +241,13 @@ def compute_tight_range(df: pd.DataFrame, window: int = 10, max_pct: float = 8.0
     return result
 
 
-def compute_close_near_high(df: pd.DataFrame, max_pct: float = 2.0) -> dict:
+def compute_close_near_high(high: np.ndarray, close: np.ndarray, max_pct: float = 2.0) -> dict:
     """
     Check if today's close is near today's high (breakout quality signal).
 
     Args:
-        df: DataFrame with 'High', 'Close' columns
+        high: Float64 array of daily highs
+        close: Float64 array of daily closes
         max_pct: Maximum percentage from high to be considered "near"
 
     Returns:
@@ -239,11 +255,11 @@ def compute_close_near_high(df: pd.DataFrame, max_pct: float = 2.0) -> dict:
     """
     result = {"close_to_high_pct": None, "close_near_high": False}
 
-    if len(df) < 1:
+    if len(close) < 1:
         return result
 
-    high_today = df['High'].iloc[-1]
-    close_today = df['Close'].iloc[-1]
+    high_today = high[-1]
+    close_today = close[-1]
 
     if high_today > 0:
         pct = (high_today - close_today) / high_today * 100
@@ -270,32 +286,62 @@ def is_cache_fresh(symbol: str, metadata: dict) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=256)
+def _read_parquet_cached(cache_path: str, mtime_ns: int) -> pd.DataFrame:
+    """Decode a cached parquet (memoized per file version; callers must not mutate)."""
+    return pd.read_parquet(cache_path, columns=OHLCV_COLUMNS)
+
+
 def load_cached_ohlcv(yf_symbol: str) -> pd.DataFrame | None:
     """Load OHLCV from cache.
 
+    Repeat loads of an unchanged file within a process reuse the decoded
+    frame; rewriting the parquet changes its mtime and forces a re-read.
+
     Args:
         yf_symbol: Full symbol with exchange suffix (e.g., RELIANCE.NS)
     """
-    cache_path = CACHE_DIR / f"{yf_symbol}.parquet"
-    if cache_path.exists():
-        return pd.read_parquet(cache_path)
-
     # Fallback: try without suffix for backwards compatibility
-    base_symbol = display_symbol(yf_symbol)
-    cache_path = CACHE_DIR / f"{base_symbol}.parquet"
-    if cache_path.exists():
-        return pd.read_parquet(cache_path)
+    for name in (yf_symbol, display_symbol(yf_symbol)):
+        cache_path = CACHE_DIR / f"{name}.parquet"
+        try:
+            mtime_ns = cache_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            continue
+        return _read_parquet_cached(str(cache_path), mtime_ns)
 
     return None
 
 
-def fetch_with_backoff(yf_symbol: str, metadata: dict, retries: int = 0) -> pd.DataFrame | None:
+def cache_ohlcv(yf_symbol: str, df: pd.DataFrame, metadata: dict) -> None:
+    """Write fetched OHLCV to the parquet cache and record it in metadata.
+
+    `metadata` is only updated in memory; analyze_batch flushes it once.
+    CACHE_DIR must exist (analyze_batch creates it once per run).
+    """
+    # Atomic write via temp file
+    cache_path = CACHE_DIR / f"{yf_symbol}.parquet"
+    temp_path = cache_path.with_suffix(".parquet.tmp")
+    df[OHLCV_COLUMNS].to_parquet(temp_path, engine="pyarrow", compression="zstd", compression_level=3)
+    temp_path.replace(cache_path)
+
+    metadata[yf_symbol] = {
+        "last_fetched": datetime.now().isoformat(),
+        "rows": len(df)
+    }
+
+
+def fetch_with_backoff(yf_symbol: str, metadata: dict) -> pd.DataFrame | None:
     """Fetch OHLCV with exponential backoff on failure.
 
+    Retries reuse one Ticker (and its session/crumb). Each wait gets up to
+    1s of random jitter so threads that hit a rate limit together don't
+    retry in lockstep.
+
     Args:
         yf_symbol: Full symbol with exchange suffix (e.g., RELIANCE.NS)
-        metadata: Cache metadata dict (will be updated in-place on success)
-        retries: Current retry count (internal use)
+        metadata: Cache metadata dict (updated in-place on success; the
+            caller writes it back to disk)
 
     Returns:
         DataFrame with OHLCV data, or None on failure
@@ -304,69 +350,111 @@ def fetch_with_backoff(yf_symbol: str, metadata: dict, retries: int = 0) -> pd.D
         log("yfinance not installed")
         return None
 
-    try:
-        log(f"  Fetching {yf_symbol}...")
-        ticker = yf.Ticker(yf_symbol)
-        df = ticker.history(period="1y")
-
-        if df is not None and not df.empty:
-            # Cache it (atomic write via temp file)
-            CACHE_DIR.mkdir(parents=True, exist_ok=True)
-            cache_path = CACHE_DIR / f"{yf_symbol}.parquet"
-            temp_path = cache_path.with_suffix(".parquet.tmp")
-            df.to_parquet(temp_path)
-            temp_path.replace(cache_path)
-
-            # Update metadata in memory and on disk
-            metadata[yf_symbol] = {
-                "last_fetched": datetime.now().isoformat(),
-                "rows": len(df)
-            }
-            save_json(CACHE_METADATA_PATH, metadata)
+    log(f"  Fetching {yf_symbol}...")
+    ticker = yf.Ticker(yf_symbol)
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            df = ticker.history(period="1y")
 
-            return df
+            if df is not None and not df.empty:
+                cache_ohlcv(yf_symbol, df, metadata)
+                return df
 
-        log(f"  No data for {yf_symbol}")
-        return None
+            log(f"  No data for {yf_symbol}")
+            return None
 
-    except Exception as e:
-        if retries < MAX_RETRIES:
-            # Exponential backoff: 2s, 4s, 8s
-            wait = BASE_WAIT_SECONDS * (2 ** retries)
-            log(f"  Retry {yf_symbol} in {wait}s... ({e})")
+        except Exception as e:
+            if attempt == MAX_RETRIES:
+                log(f"  Failed to fetch {yf_symbol} after {MAX_RETRIES} retries")
+                return None
+            # Exponential backoff: 2s, 4s, 8s (+ jitter)
+            wait = BASE_WAIT_SECONDS * (2 ** attempt) + random.uniform(0, 1)
+            log(f"  Retry {yf_symbol} in {wait:.1f}s... ({e})")
             time.sleep(wait)
-            return fetch_with_backoff(yf_symbol, metadata, retries + 1)
-        else:
-            log(f"  Failed to fetch {yf_symbol} after {MAX_RETRIES} retries")
-            return None
+
+
+def fetch_bulk(yf_symbols: list[str], metadata: dict) -> dict[str, pd.DataFrame]:
+    """Download a batch of symbols with one yf.download() call.
+
+    Returns only the symbols that came back with data (each cached like
+    fetch_with_backoff does); anything missing is left to the caller.
+    """
+    try:
+        log(f"  Fetching {', '.join(yf_symbols)}...")
+        # auto_adjust / tz-aware index match Ticker.history(), so cached
+        # frames look the same whichever path fetched them
+        bulk = yf.download(
+            yf_symbols, period="1y", group_by="ticker", auto_adjust=True,
+            ignore_tz=False, multi_level_index=True, threads=True, progress=False,
+        )
+    except Exception as e:
+        log(f"  Bulk fetch failed ({e})")
+        return {}
+    if bulk is None or bulk.empty:
+        return {}
+
+    frames = {}
+    tickers = set(bulk.columns.get_level_values(0))
+    for yf_symbol in yf_symbols:
+        if yf_symbol not in tickers:
+            continue
+        # Rows where only other tickers traded are all-NaN for this one
+        df = bulk[yf_symbol].dropna(how="all")
+        if df.empty:
+            continue
+        df.columns.name = None
+        cache_ohlcv(yf_symbol, df, metadata)
+        frames[yf_symbol] = df
+    return frames
+
+
+def fetch_batch(yf_symbols: list[str], metadata: dict) -> dict[str, pd.DataFrame | None]:
+    """Fetch one batch of symbols.
+
+    One bulk yf.download() covers the batch; symbols it misses are retried
+    per symbol with backoff, side by side in threads since fetching is
+    network-bound. Each worker only adds its own symbol's entry to
+    `metadata`.
+
+    Returns:
+        {yf_symbol: DataFrame or None}
+    """
+    if not yf_symbols:
+        return {}
+    frames: dict[str, pd.DataFrame | None] = fetch_bulk(yf_symbols, metadata)
+    missing = [s for s in yf_symbols if s not in frames]
+    if missing:
+        with ThreadPoolExecutor(max_workers=len(missing)) as ex:
+            frames.update(zip(missing, ex.map(lambda s: fetch_with_backoff(s, metadata), missing)))
+    return frames
 
 
 def compute_full_analysis(df: pd.DataFrame) -> dict:
     """Compute all technical indicators.
 
-    Uses safe_float() to handle NaN values gracefully.
+    RSI/MACD/Bollinger/ADX/volume average come from a single compiled
+    kernels.technical_scalars() call (pandas_ta math, latest bar only);
+    SMAs from sma_last(). Uses safe_float() to handle NaN values gracefully.
     """
     result = {}
+    # Pull each column out once; everything below (helpers included)
+    # indexes plain arrays
+    close = np.ascontiguousarray(df['Close'].to_numpy(dtype=np.float64))
+    high = df['High'].to_numpy(dtype=np.float64)
+    low = df['Low'].to_numpy(dtype=np.float64)
+    volume = df['Volume'].to_numpy(dtype=np.float64)
+    ind = kernels.technical_scalars(df)
 
     # Current price
-    result["price"] = safe_float(df['Close'].iloc[-1], 0)
-    if len(df) > 1 and result["price"] > 0:
-        prev_close = safe_float(df['Close'].iloc[-2], result["price"])
+    result["price"] = safe_float(close[-1], 0)
+    if len(close) > 1 and result["price"] > 0:
+        prev_close = safe_float(close[-2], result["price"])
         result["price_change_1d"] = ((result["price"] / prev_close) - 1) * 100 if prev_close > 0 else 0
     else:
         result["price_change_1d"] = 0
 
     # RSI
-    if HAS_PANDAS_TA:
-        rsi = ta.rsi(df['Close'], length=14)
-        result["rsi"] = safe_float(rsi.iloc[-1] if rsi is not None else None, 50.0)
-    else:
-        delta = df['Close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        result["rsi"] = safe_float(rsi.iloc[-1], 50.0)
+    result["rsi"] = safe_float(ind["rsi"], 50.0)
 
     # RSI interpretation
     if result["rsi"] < 30:
@@ -379,31 +467,15 @@ def compute_full_analysis(df: pd.DataFrame) -> dict:
         result["rsi_signal"] = "Neutral"
 
     # MACD
-    if HAS_PANDAS_TA:
-        macd_df = ta.macd(df['Close'], fast=12, slow=26, signal=9)
-        if macd_df is not None:
-            # Use column name filter for robustness
-            macd_cols = macd_df.filter(like="MACD_12_26_9").columns
-            signal_cols = macd_df.filter(like="MACDs_12_26_9").columns
-            result["macd"] = safe_float(macd_df[macd_cols[0]].iloc[-1] if len(macd_cols) > 0 else None, 0)
-            result["macd_signal"] = safe_float(macd_df[signal_cols[0]].iloc[-1] if len(signal_cols) > 0 else None, 0)
-        else:
-            result["macd"] = 0
-            result["macd_signal"] = 0
-    else:
-        exp1 = df['Close'].ewm(span=12, adjust=False).mean()
-        exp2 = df['Close'].ewm(span=26, adjust=False).mean()
-        macd = exp1 - exp2
-        signal = macd.ewm(span=9, adjust=False).mean()
-        result["macd"] = safe_float(macd.iloc[-1], 0)
-        result["macd_signal"] = safe_float(signal.iloc[-1], 0)
+    result["macd"] = safe_float(ind["macd"], 0)
+    result["macd_signal"] = safe_float(ind["macd_signal"], 0)
 
     result["macd_bullish"] = result["macd"] > result["macd_signal"]
 
     # SMAs
-    result["sma20"] = safe_float(df['Close'].rolling(20).mean().iloc[-1]) if len(df) >= 20 else None
-    result["sma50"] = safe_float(df['Close'].rolling(50).mean().iloc[-1]) if len(df) >= 50 else None
-    result["sma200"] = safe_float(df['Close'].rolling(200).mean().iloc[-1]) if len(df) >= 200 else None
+    result["sma20"] = sma_last(close, 20)
+    result["sma50"] = sma_last(close, 50)
+    result["sma200"] = sma_last(close, 200)
 
     # Percent from SMAs
     if result["sma20"] is not None and result["sma20"] > 0:
@@ -442,17 +514,7 @@ def compute_full_analysis(df: pd.DataFrame) -> dict:
         result["golden_cross"] = None
 
     # ADX
-    if HAS_PANDAS_TA:
-        adx_df = ta.adx(df['High'], df['Low'], df['Close'], length=14)
-        if adx_df is not None:
-            # Use column name filter for robustness
-            adx_cols = adx_df.filter(like="ADX_14").columns
-            result["adx"] = safe_float(adx_df[adx_cols[0]].iloc[-1] if len(adx_cols) > 0 else None)
-        else:
-            result["adx"] = None
-    else:
-        # ADX requires complex calculation; set to None if pandas_ta not available
-        result["adx"] = None
+    result["adx"] = safe_float(ind["adx"])
 
     # ADX interpretation (only if available)
     if result["adx"] is not None:
@@ -466,8 +528,8 @@ def compute_full_analysis(df: pd.DataFrame) -> dict:
         result["adx_signal"] = "N/A"
 
     # Volume
-    vol_avg = safe_float(df['Volume'].rolling(20).mean().iloc[-1])
-    vol_today = safe_float(df['Volume'].iloc[-1])
+    vol_avg = safe_float(ind["vol_sma20"])
+    vol_today = safe_float(volume[-1])
     if vol_avg and vol_avg > 0 and vol_today is not None:
         result["volume_ratio"] = vol_today / vol_avg
     else:
@@ -475,8 +537,9 @@ def compute_full_analysis(df: pd.DataFrame) -> dict:
     result["volume_signal"] = "HIGH" if result["volume_ratio"] > 1.5 else "Normal"
 
     # 52-week high/low
-    result["high_52w"] = safe_float(df['High'].max(), result["price"])
-    result["low_52w"] = safe_float(df['Low'].min(), result["price"])
+    # fmax/fmin skip NaNs like pandas max()/min() (NaN only if all are NaN)
+    result["high_52w"] = safe_float(np.fmax.reduce(high), result["price"])
+    result["low_52w"] = safe_float(np.fmin.reduce(low), result["price"])
     if result["high_52w"] and result["high_52w"] > 0:
         result["pct_from_high"] = (result["high_52w"] - result["price"]) / result["high_52w"] * 100
     else:
@@ -487,28 +550,8 @@ def compute_full_analysis(df: pd.DataFrame) -> dict:
         result["pct_from_low"] = 0
 
     # Bollinger Bands
-    if HAS_PANDAS_TA:
-        bb = ta.bbands(df['Close'], length=20, std=2)
-        if bb is not None:
-            # Use column name filter for robustness (BBU = upper, BBL = lower)
-            upper_cols = bb.filter(like="BBU_").columns
-            lower_cols = bb.filter(like="BBL_").columns
-            result["bb_upper"] = safe_float(
-                bb[upper_cols[0]].iloc[-1] if len(upper_cols) > 0 else None,
-                result["price"]
-            )
-            result["bb_lower"] = safe_float(
-                bb[lower_cols[0]].iloc[-1] if len(lower_cols) > 0 else None,
-                result["price"]
-            )
-        else:
-            result["bb_upper"] = result["price"]
-            result["bb_lower"] = result["price"]
-    else:
-        sma20 = df['Close'].rolling(20).mean()
-        std20 = df['Close'].rolling(20).std()
-        result["bb_upper"] = safe_float((sma20 + 2 * std20).iloc[-1], result["price"])
-        result["bb_lower"] = safe_float((sma20 - 2 * std20).iloc[-1], result["price"])
+    result["bb_upper"] = safe_float(ind["bb_upper"], result["price"])
+    result["bb_lower"] = safe_float(ind["bb_lower"], result["price"])
 
     if result["price"] <= result["bb_lower"]:
         result["bb_signal"] = "At lower band"
@@ -524,7 +567,7 @@ def compute_full_analysis(df: pd.DataFrame) -> dict:
     # Support level via pivot-low detection
     rules = SCAN_SETUP_RULES
     support_level = compute_support_level(
-        df, result["price"],
+        low, result["price"],
         lookback=rules["pivot_lookback"],
         k=rules["pivot_window"]
     )
@@ -535,14 +578,14 @@ def compute_full_analysis(df: pd.DataFrame) -> dict:
         result["pct_above_support"] = None
 
     # Donchian breakout metrics
-    donchian = compute_donchian_breakout(df, window=rules["breakout_window"])
+    donchian = compute_donchian_breakout(high, close, window=rules["breakout_window"])
     result["donchian_high_20"] = donchian["donchian_high_20"]
     result["breakout_today"] = donchian["breakout_today"]
     result["days_since_breakout_20"] = donchian["days_since_breakout_20"]
 
     # Tight range / compression
     tight = compute_tight_range(
-        df,
+        high, low, close,
         window=rules["tight_range_window"],
         max_pct=rules["tight_range_max_pct"]
     )
@@ -550,7 +593,7 @@ def compute_full_analysis(df: pd.DataFrame) -> dict:
     result["tight_range"] = tight["tight_range"]
 
     # Close near high (breakout quality)
-    near_high = compute_close_near_high(df, max_pct=rules["close_near_high_max_pct"])
+    near_high = compute_close_near_high(high, close, max_pct=rules["close_near_high_max_pct"])
     result["close_to_high_pct"] = near_high["close_to_high_pct"]
     result["close_near_high"] = near_high["close_near_high"]
 
@@ -644,6 +687,8 @@ def analyze_batch(symbols: list[str], us_market: bool = False, verbose: bool = T
 
     metadata = load_json(CACHE_METADATA_PATH) or {}
     results = []
+    # Once per run, not once per cached fetch
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
     # Normalize all symbols upfront
     normalized = [normalize_symbol_for_market(s, us_market) for s in symbols]
@@ -651,62 +696,77 @@ def analyze_batch(symbols: list[str], us_market: bool = False, verbose: bool = T
     if verbose:
         print(f"\nAnalyzing {total} stocks...\n")
 
-    for i in range(0, len(normalized), BATCH_SIZE):
-        batch = normalized[i:i + BATCH_SIZE]
-        batch_num = i // BATCH_SIZE + 1
-        total_batches = (len(normalized) + BATCH_SIZE - 1) // BATCH_SIZE
+    # Fetches update `metadata` in memory; write it back once at the end
+    # (also on Ctrl-C) instead of rewriting the file after every symbol
+    metadata_dirty = False
+    try:
+        for i in range(0, len(normalized), BATCH_SIZE):
+            batch = normalized[i:i + BATCH_SIZE]
+            batch_num = i // BATCH_SIZE + 1
+            total_batches = (len(normalized) + BATCH_SIZE - 1) // BATCH_SIZE
 
-        if verbose:
-            print(f"Batch {batch_num}/{total_batches}: {', '.join(display_symbol(s) for s in batch)}")
+            if verbose:
+                print(f"Batch {batch_num}/{total_batches}: {', '.join(display_symbol(s) for s in batch)}")
 
-        for yf_symbol in batch:
-            disp_symbol = display_symbol(yf_symbol)
+            # Fetch every stale symbol of the batch at once; fresh ones
+            # come from the parquet cache below
+            fresh = {s for s in batch if is_cache_fresh(s, metadata)}
+            fetched = fetch_batch([s for s in batch if s not in fresh], metadata)
+            metadata_dirty |= any(df is not None for df in fetched.values())
 
-            # Check cache first
-            if is_cache_fresh(yf_symbol, metadata):
-                log(f"  {disp_symbol}: Using cached data")
-                ohlcv = load_cached_ohlcv(yf_symbol)
-            else:
-                ohlcv = fetch_with_backoff(yf_symbol, metadata)
+            for yf_symbol in batch:
+                disp_symbol = display_symbol(yf_symbol)
 
-            if ohlcv is None or ohlcv.empty:
-                if verbose:
-                    print(f"  {disp_symbol}: ERROR - Could not fetch data")
-                continue
+                if yf_symbol in fresh:
+                    log(f"  {disp_symbol}: Using cached data")
+                    ohlcv = load_cached_ohlcv(yf_symbol)
+                else:
+                    ohlcv = fetched[yf_symbol]
 
-            # Run full analysis
-            analysis = compute_full_analysis(ohlcv)
-            analysis["symbol"] = disp_symbol
-            analysis["yf_symbol"] = yf_symbol
+                if ohlcv is None or ohlcv.empty:
+                    if verbose:
+                        print(f"  {disp_symbol}: ERROR - Could not fetch data")
+                    continue
 
-            # Save to scan_technical folder (separate from portfolio analysis)
-            SCAN_TECHNICAL_DIR.mkdir(parents=True, exist_ok=True)
-            save_json(SCAN_TECHNICAL_DIR / f"{disp_symbol}.json", analysis)
+                # Run full analysis
+                analysis = compute_full_analysis(ohlcv)
+                analysis["symbol"] = disp_symbol
+                analysis["yf_symbol"] = yf_symbol
 
-            results.append(analysis)
+                # Save to scan_technical folder (separate from portfolio analysis);
+                # save_json creates the directory
+                save_json(SCAN_TECHNICAL_DIR / f"{disp_symbol}.json", analysis)
 
-            # Print summary
-            if verbose:
-                rec = analysis["recommendation"]
-                score = analysis["technical_score"]
-                rsi = analysis["rsi"]
-                trend = analysis["trend"]
-                macd = "↑" if analysis["macd_bullish"] else "↓"
-                print(f"  {disp_symbol}: Score {score:.1f} | {rec} | RSI {rsi:.0f} | MACD {macd} | {trend}")
-
-        # Delay between batches
-        if i + BATCH_SIZE < len(normalized):
-            if verbose:
-                print(f"\n  Waiting {DELAY_BETWEEN_BATCH}s before next batch...\n")
-            time.sleep(DELAY_BETWEEN_BATCH)
+                results.append(analysis)
 
-    # Summary table (only in verbose mode)
+                # Print summary
+                if verbose:
+                    rec = analysis["recommendation"]
+                    score = analysis["technical_score"]
+                    rsi = analysis["rsi"]
+                    trend = analysis["trend"]
+                    macd = "↑" if analysis["macd_bullish"] else "↓"
+                    print(f"  {disp_symbol}: Score {score:.1f} | {rec} | RSI {rsi:.0f} | MACD {macd} | {trend}")
+
+            # Delay between batches
+            if i + BATCH_SIZE < len(normalized):
+                if verbose:
+                    print(f"\n  Waiting {DELAY_BETWEEN_BATCH}s before next batch...\n")
+                time.sleep(DELAY_BETWEEN_BATCH)
+    finally:
+        if metadata_dirty:
+            save_json(CACHE_METADATA_PATH, metadata)
+
+    # Summary table (only in verbose mode) — built as lines and written in
+    # one call so it isn't interleaved with other output
     if verbose:
-        print(f"\n{'='*80}")
-        print(f"{'Symbol':<12} {'Score':<7} {'Rec':<12} {'RSI':<8} {'MACD':<8} {'Trend':<12} {'52W':<10}")
-        print(f"{'='*80}")
+        lines = [
+            f"\n{'='*80}",
+            f"{'Symbol':<12} {'Score':<7} {'Rec':<12} {'RSI':<8} {'MACD':<8} {'Trend':<12} {'52W':<10}",
+            f"{'='*80}",
+        ]
 
-        for r in sorted(results, key=lambda x: x["technical_score"], reverse=True):
+        for r in sorted(results, key=itemgetter("technical_score"), reverse=True):
             symbol = r["symbol"]
             score = r["technical_score"]
             rec = r["recommendation"]
@@ -715,21 +775,21 @@ def analyze_batch(symbols: list[str], us_market: bool = False, verbose: bool = T
             trend = r["trend"]
             pct_high = f"{r['pct_from_high']:.1f}% off"
 
-            print(f"{symbol:<12} {score:<7.1f} {rec:<12} {rsi:<8.1f} {macd:<8} {trend:<12} {pct_high:<10}")
+            lines.append(f"{symbol:<12} {score:<7.1f} {rec:<12} {rsi:<8.1f} {macd:<8} {trend:<12} {pct_high:<10}")
+
+        # Group by recommendation in one pass (input order within a group)
+        by_rec: dict[str, list[str]] = {}
+        for r in results:
+            by_rec.setdefault(r["recommendation"], []).append(r["symbol"])
 
-        print(f"{'='*80}\n")
+        lines.append(f"{'='*80}\n")
 
-        # Group by recommendation
-        strong_buys = [r for r in results if r["recommendation"] == "STRONG BUY"]
-        buys = [r for r in results if r["recommendation"] == "BUY"]
-        holds = [r for r in results if r["recommendation"] == "HOLD"]
+        for rec in ("STRONG BUY", "BUY", "HOLD"):
+            if rec in by_rec:
+                lines.append(f"{rec}: {', '.join(by_rec[rec])}")
 
-        if strong_buys:
-            print(f"STRONG BUY: {', '.join(r['symbol'] for r in strong_buys)}")
-        if buys:
-            print(f"BUY: {', '.join(r['symbol'] for r in buys)}")
-        if holds:
-            print(f"HOLD: {', '.join(r['symbol'] for r in holds)}")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
     return results
 
@@ -1,10 +1,12 @@
 """Tests for utils/data.py — data access layer."""
 
 import json
+import os
 import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 
 from utils import data
@@ -114,6 +116,15 @@ def test_load_latest_scan():
     assert scan is None or isinstance(scan, dict)
 
 
+def test_latest_scan_file(tmp_path):
+    assert data.latest_scan_file(tmp_path / "missing") is None
+    assert data.latest_scan_file(tmp_path) is None
+    for name in ["scan_20250101_090000.json", "scan_20250310_153000.json",
+                 "scan_20250310_093000.json", "scan_99999999.txt", "notes.json"]:
+        (tmp_path / name).write_text("{}")
+    assert data.latest_scan_file(tmp_path) == tmp_path / "scan_20250310_153000.json"
+
+
 def test_load_ledger():
     entries = data.load_ledger()
     assert isinstance(entries, list)
@@ -122,3 +133,42 @@ def test_load_ledger():
 def test_load_outcomes():
     outcomes = data.load_outcomes()
     assert isinstance(outcomes, list)
+
+
+def test_indicator_cache_roundtrip(tmp_path):
+    ohlcv_dir = tmp_path / "ohlcv"
+    ind_dir = tmp_path / "indicators"
+    ohlcv_dir.mkdir()
+    (ohlcv_dir / "TEST.NS.parquet").write_bytes(b"")
+    with patch.object(data, "CACHE_DIR", ohlcv_dir), patch.object(data, "IND_CACHE_DIR", ind_dir):
+        assert data.load_indicator_cache("TEST.NS", 1) is None
+        data.save_indicator_cache("TEST.NS", {"Close": np.arange(5.0), "rsi": np.full(5, np.nan)}, 1)
+        cached = data.load_indicator_cache("TEST.NS", 1)
+        assert cached is not None
+        assert cached.dtype.names == ("Close", "rsi", data.IND_CACHE_VERSION_FIELD)
+        assert cached["Close"].tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+        assert list(ind_dir.iterdir()) == [ind_dir / "TEST.NS.npy"]
+
+
+def test_indicator_cache_rejects_other_version(tmp_path):
+    ohlcv_dir = tmp_path / "ohlcv"
+    ind_dir = tmp_path / "indicators"
+    ohlcv_dir.mkdir()
+    (ohlcv_dir / "TEST.NS.parquet").write_bytes(b"")
+    with patch.object(data, "CACHE_DIR", ohlcv_dir), patch.object(data, "IND_CACHE_DIR", ind_dir):
+        data.save_indicator_cache("TEST.NS", {"Close": np.arange(3.0)}, 3_000_000_001)
+        assert data.load_indicator_cache("TEST.NS", 3_000_000_001) is not None
+        assert data.load_indicator_cache("TEST.NS", 3_000_000_002) is None
+
+
+def test_indicator_cache_stale_when_ohlcv_newer(tmp_path):
+    ohlcv_dir = tmp_path / "ohlcv"
+    ind_dir = tmp_path / "indicators"
+    ohlcv_dir.mkdir()
+    src = ohlcv_dir / "TEST.NS.parquet"
+    src.write_bytes(b"")
+    with patch.object(data, "CACHE_DIR", ohlcv_dir), patch.object(data, "IND_CACHE_DIR", ind_dir):
+        path = data.save_indicator_cache("TEST.NS", {"Close": np.arange(3.0)}, 1)
+        mtime = path.stat().st_mtime
+        os.utime(src, (mtime + 10, mtime + 10))
+        assert data.load_indicator_cache("TEST.NS", 1) is None
@@ -1,11 +1,13 @@
 """Tests for utils/indicators.py — shared computation layer."""
 
 import os
+from unittest.mock import patch
 
 import pandas as pd
 import pytest
 
 from utils.indicators import compute_all, find_swing_points, extract_latest
+from utils import data
 from utils.data import load_ohlcv, CACHE_DIR
 
 
@@ -119,3 +121,34 @@ def test_find_swing_points_structure(sample_df):
         idx, val = highs[0]
         assert isinstance(idx, int)
         assert isinstance(val, float)
+
+
+def test_compute_all_reuses_indicator_cache(tmp_path):
+    idx = pd.bdate_range("2024-01-01", periods=260)
+    close = pd.Series(range(260), index=idx, dtype=float) * 0.5 + 100
+    df = pd.DataFrame({
+        "Open": close - 0.3, "High": close + 1.0, "Low": close - 1.0,
+        "Close": close, "Volume": 1_000_000.0,
+    })
+    ohlcv_dir = tmp_path / "ohlcv"
+    ohlcv_dir.mkdir()
+    df.to_parquet(ohlcv_dir / "TEST.NS.parquet")
+
+    with patch.object(data, "CACHE_DIR", ohlcv_dir), \
+            patch.object(data, "IND_CACHE_DIR", tmp_path / "indicators"):
+        loaded = data.load_ohlcv("TEST.NS")
+        fresh = compute_all(loaded)["df"]
+        assert (tmp_path / "indicators" / "TEST.NS.npy").exists()
+
+        cached = compute_all(data.load_ohlcv("TEST.NS"))["df"]
+        pd.testing.assert_frame_equal(cached, fresh, check_like=True)
+
+        # A slice no longer matches the cache and is recomputed
+        tail = compute_all(loaded.tail(120))["df"]
+        assert len(tail) == 120
+
+        # So is a cache written under other parameters/code
+        with patch("utils.indicators._indicator_cache_version", return_value=0):
+            assert data.load_indicator_cache("TEST.NS", 0) is None
+            recomputed = compute_all(data.load_ohlcv("TEST.NS"))["df"]
+        pd.testing.assert_frame_equal(recomputed, fresh, check_like=True)
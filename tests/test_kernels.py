@@ -0,0 +1,178 @@
+"""Tests for utils/kernels.py — kernels must match pandas_ta."""
+
+import importlib.util
+import math
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.indicators import compute_all
+from utils import kernels
+from utils.kernels import SCALAR_FIELDS, SCORE_KEYS, score_batch, technical_scalars
+
+TA_SCRIPT = Path(__file__).parent.parent / "scripts" / "technical_analysis.py"
+
+
+def _make_df(n: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0005, 0.02, n)))
+    open_ = close * (1 + rng.normal(0, 0.005, n))
+    high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.01, n)))
+    low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.01, n)))
+    volume = rng.integers(100_000, 1_000_000, n).astype(float)
+    idx = pd.bdate_range("2024-01-01", periods=n)
+    return pd.DataFrame(
+        {"Open": open_, "High": high, "Low": low, "Close": close, "Volume": volume},
+        index=idx,
+    )
+
+
+def _assert_close(actual, expected, field):
+    if expected is None or math.isnan(expected):
+        assert math.isnan(actual), field
+    else:
+        assert actual == pytest.approx(expected, rel=1e-9, abs=1e-9), field
+
+
+@pytest.mark.parametrize("n,seed", [(300, 1), (120, 2), (60, 3)])
+def test_series_kernels_match_pandas_ta(n, seed):
+    ta = pytest.importorskip("pandas_ta")
+    df = _make_df(n, seed)
+    df.iloc[n // 2, df.columns.get_loc("Close")] = np.nan  # NaN gap mid-series
+    close, high, low = (df[c].to_numpy() for c in ("Close", "High", "Low"))
+
+    expected = {
+        "rsi": [ta.rsi(df["Close"], length=14)],
+        "macd": [ta.macd(df["Close"], fast=12, slow=26, signal=9).iloc[:, i] for i in (0, 2, 1)],
+        "sma": [ta.sma(df["Close"], length=50)],
+        "bbands": [ta.bbands(df["Close"], length=20, std=2.0).iloc[:, i] for i in range(5)],
+        "adx": [ta.adx(df["High"], df["Low"], df["Close"], length=14)[c]
+                for c in ("ADX_14", "DMP_14", "DMN_14")],
+        "atr": [ta.atr(df["High"], df["Low"], df["Close"], length=14)],
+    }
+    actual = {
+        "rsi": [kernels.rsi(close, 14)],
+        "macd": kernels.macd(close, 12, 26, 9),
+        "sma": [kernels.sma(close, 50)],
+        "bbands": kernels.bbands(close, 20, 2.0),
+        "adx": kernels.adx(high, low, close, 14),
+        "atr": [kernels.atr(high, low, close, 14)],
+    }
+    for name in expected:
+        for got, want in zip(actual[name], expected[name]):
+            np.testing.assert_allclose(got, want.to_numpy(), rtol=1e-10, atol=1e-10,
+                                       equal_nan=True, err_msg=name)
+
+
+@pytest.mark.parametrize("nan_close", [False, True])
+def test_technical_scalars_match_compute_all(nan_close):
+    df = _make_df(300, 1)
+    if nan_close:
+        df.iloc[150, df.columns.get_loc("Close")] = np.nan
+    enriched = compute_all(df)["df"]
+    latest = enriched.iloc[-1]
+    prev = enriched.iloc[-2]
+
+    result = technical_scalars(df)
+    assert set(result) == set(SCALAR_FIELDS)
+
+    expected = {
+        "close": latest["Close"],
+        "open": latest["Open"],
+        "macd_prev": prev["macd"],
+        "macd_signal_prev": prev["macd_signal"],
+    }
+    for field in SCALAR_FIELDS:
+        _assert_close(result[field], expected.get(field, latest.get(field)), field)
+
+
+@pytest.mark.parametrize("price", [100.0, 78.826, 78.82612345, 1234.567, 0.3])
+def test_bbands_flat_window_matches_pandas_ta(price):
+    ta = pytest.importorskip("pandas_ta")
+    df = _make_df(80, 4)
+    df.iloc[-25:, :4] = price
+    pctb = kernels.bbands(df["Close"].to_numpy(), 20, 2.0)[4]
+    expected = ta.bbands(df["Close"], length=20, std=2.0).iloc[:, 4].to_numpy()
+    np.testing.assert_allclose(pctb, expected, rtol=1e-10, equal_nan=True)
+
+
+@pytest.mark.parametrize("price", [100.0, 78.826])
+def test_tail_kernels_flat_series(price):
+    flat = np.full(100, price)
+    assert math.isnan(kernels.rsi_tail(flat, 14))
+    assert math.isnan(kernels.rsi(flat, 14)[-1])
+    for got, want in zip(kernels.adx_tail(flat, flat, flat, 14), kernels.adx(flat, flat, flat, 14)):
+        _assert_close(got, want[-1], "adx")
+    assert math.isnan(kernels.adx_tail(flat, flat, flat, 14)[0])
+
+
+def test_technical_scalars_zero_volume():
+    # Index tickers report Volume 0 on every bar
+    df = _make_df(300, 5)
+    df["Volume"] = 0.0
+    result = technical_scalars(df)
+    assert result["vol_sma20"] == 0.0
+    assert math.isnan(result["vol_ratio"])
+
+    ta_script = _load_technical_analysis()
+    assert ta_script.compute_technical_indicators(df)["scores"]["volume"] == 5
+
+
+@pytest.mark.parametrize("price", [100.0, 78.826, 78.82612345, 1234.567, 0.3])
+def test_bbands_tail_flat_window_matches_pandas_ta(price):
+    # A suspended stock: the whole last window sits at one (non-round) price
+    ta = pytest.importorskip("pandas_ta")
+    df = _make_df(80, 4)
+    df.iloc[-25:, :4] = price
+    expected = ta.bbands(df["Close"], length=20, std=2.0).iloc[-1].to_numpy()
+    lower, mid, upper, pctb = kernels.bbands_tail(df["Close"].to_numpy(), 20, 2.0)
+    np.testing.assert_allclose([lower, mid, upper], expected[:3], rtol=1e-12)
+    assert pctb == expected[4]
+
+
+def _load_technical_analysis():
+    spec = importlib.util.spec_from_file_location("technical_analysis", TA_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_score_batch_matches_scalar_scorers():
+    ta_script = _load_technical_analysis()
+    rng = np.random.default_rng(7)
+    n = 500
+
+    def col(low, high, nan_frac=0.05):
+        arr = rng.uniform(low, high, n)
+        arr[rng.random(n) < nan_frac] = np.nan
+        return arr
+
+    rsi = col(0, 100)
+    # Hit the exact bucket edges too
+    rsi[:6] = [25, 35, 55, 70, 80, np.nan]
+    macd, macd_signal, macd_prev = col(-2, 2), col(-2, 2), col(-2, 2)
+    close, sma50, sma200 = col(90, 110, 0), col(90, 110), col(90, 110)
+    pctb = col(-0.5, 1.5)
+    pctb[:5] = [0, 0.2, 0.5, 0.8, 1.0]
+    adx, plus_di, minus_di = col(10, 40), col(5, 40), col(5, 40)
+    adx[:3] = [20, 25, 30]
+    vol_ratio = col(0, 3)
+    is_up_day = rng.random(n) < 0.5
+    weights = [ta_script.DEFAULT_WEIGHTS[k] for k in SCORE_KEYS]  # plain floats, as in the script
+
+    result = score_batch(rsi, macd, macd_signal, macd_prev, close, sma50, sma200,
+                         pctb, adx, plus_di, minus_di, vol_ratio, is_up_day, np.array(weights))
+
+    for i in range(n):
+        scores = {
+            "rsi": ta_script.score_rsi(rsi[i]),
+            "macd": ta_script.score_macd(macd[i], macd_signal[i], macd_prev[i], np.nan),
+            "trend": ta_script.score_trend(close[i], sma50[i], sma200[i]),
+            "bollinger": ta_script.score_bollinger(pctb[i]),
+            "adx": ta_script.score_adx(adx[i], plus_di[i], minus_di[i]),
+            "volume": ta_script.score_volume(vol_ratio[i], bool(is_up_day[i])),
+        }
+        expected = sum(scores[k] * w for k, w in zip(SCORE_KEYS, weights))
+        assert result[i] == expected, i  # same compensated sum as Python
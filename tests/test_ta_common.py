@@ -0,0 +1,32 @@
+"""Tests for utils/ta_common.py — shared TA helpers."""
+
+import math
+
+import numpy as np
+
+from utils.ta_common import safe_round, safe_round_array
+
+
+def test_safe_round_array_matches_safe_round():
+    values = [1.23456, np.float64(98.7654321), None, float("nan"), np.int64(7)]
+    decimals = [2, 4, 2, 4, 2]
+    expected = [safe_round(v, d) for v, d in zip(values, decimals)]
+    assert safe_round_array(values, decimals) == expected
+
+
+def test_safe_round_array_scalar_decimals():
+    result = safe_round_array([1.23456, math.nan], 2)
+    assert result == [1.23, None]
+    assert isinstance(result[0], float)
+
+
+def test_safe_round_array_ties_match_safe_round():
+    # Values ending in ...5 where np.round and round() disagree
+    rng = np.random.default_rng(0)
+    for decimals in (2, 4):
+        step = 10.0 ** -decimals
+        values = [2278.015, 3526.565, 0.00125, 12.34565] + [
+            float(f"{x:.{decimals}f}") + step / 2 for x in rng.uniform(1, 5000, 2000)
+        ]
+        expected = [safe_round(v, decimals) for v in values]
+        assert safe_round_array(values, decimals) == expected
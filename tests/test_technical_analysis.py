@@ -0,0 +1,47 @@
+"""Tests for scripts/technical_analysis.py saved-output reuse."""
+
+import importlib.util
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+TA_SCRIPT = Path(__file__).parent.parent / "scripts" / "technical_analysis.py"
+
+
+@pytest.fixture(scope="module")
+def ta_script():
+    spec = importlib.util.spec_from_file_location("technical_analysis", TA_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _write_ohlcv(base: Path, symbol: str, n: int = 260) -> None:
+    rng = np.random.default_rng(0)
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0005, 0.02, n)))
+    df = pd.DataFrame(
+        {"Open": close, "High": close * 1.01, "Low": close * 0.99,
+         "Close": close, "Volume": 1_000_000.0},
+        index=pd.bdate_range("2024-01-01", periods=n),
+    )
+    (base / "cache" / "ohlcv").mkdir(parents=True)
+    df.to_parquet(base / "cache" / "ohlcv" / f"{symbol}.parquet")
+
+
+def test_saved_output_reused_only_for_same_version(ta_script, tmp_path):
+    _write_ohlcv(tmp_path, "TEST.NS")
+    weights = ta_script.DEFAULT_WEIGHTS.copy()
+
+    first = ta_script.run_for_symbol("TEST.NS", weights, base_path=tmp_path, quiet=True)
+    assert first["output_version"] == ta_script.output_version()
+
+    output_path = tmp_path / "data" / "technical" / "TEST.NS.json"
+    in_stat = (tmp_path / "cache" / "ohlcv" / "TEST.NS.parquet").stat()
+    assert ta_script.load_fresh_output(output_path, in_stat, weights) == first
+
+    # Scoring code or ta_config changed since the file was written
+    with patch.object(ta_script, "output_version", return_value=first["output_version"] + 1):
+        assert ta_script.load_fresh_output(output_path, in_stat, weights) is None
@@ -0,0 +1,56 @@
+"""Tests for scripts/verify_scan.py compute_full_analysis() edge cases."""
+
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+VERIFY_SCRIPT = Path(__file__).parent.parent / "scripts" / "verify_scan.py"
+
+
+@pytest.fixture(scope="module")
+def verify_scan():
+    spec = importlib.util.spec_from_file_location("verify_scan", VERIFY_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _make_df(n: int = 300, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0005, 0.02, n)))
+    open_ = close * (1 + rng.normal(0, 0.005, n))
+    high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.01, n)))
+    low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.01, n)))
+    volume = rng.integers(100_000, 1_000_000, n).astype(float)
+    idx = pd.bdate_range("2024-01-01", periods=n)
+    return pd.DataFrame(
+        {"Open": open_, "High": high, "Low": low, "Close": close, "Volume": volume},
+        index=idx,
+    )
+
+
+def test_zero_volume_frame(verify_scan):
+    # Index tickers report Volume 0 on every bar
+    df = _make_df()
+    df["Volume"] = 0.0
+    result = verify_scan.compute_full_analysis(df)
+    assert result["volume_ratio"] == 1.0
+    assert result["volume_signal"] == "Normal"
+    assert result["rsi"] is not None
+
+
+@pytest.mark.parametrize("price", [100.0, 78.826])
+def test_flat_frame(verify_scan, price):
+    # A long-suspended stock: every bar at one price, no volume
+    df = _make_df()
+    df[["Open", "High", "Low", "Close"]] = price
+    df["Volume"] = 0.0
+    result = verify_scan.compute_full_analysis(df)
+    assert result["rsi"] == 50.0
+    assert result["volume_ratio"] == 1.0
+    assert result["adx"] is None
+    assert result["sma20"] == result["sma50"] == result["sma200"] == price
+    assert result["trend"] == "DOWN"
@@ -5,9 +5,11 @@ themselves. Returns None on missing data, never crashes.
 """
 
 import json
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 from utils.helpers import load_json, save_json
@@ -20,6 +22,7 @@ from utils.ta_common import NumpyEncoder
 BASE = Path(__file__).parent.parent
 CACHE_DIR = BASE / "cache" / "ohlcv"
 CACHE_META = BASE / "cache" / "cache_metadata.json"
+IND_CACHE_DIR = BASE / "cache" / "indicators"
 DATA = BASE / "data"
 WL_DIR = DATA / "watchlists"
 TA_DIR = DATA / "ta"
@@ -50,7 +53,11 @@ def load_ohlcv(symbol: str) -> pd.DataFrame | None:
         return None
 
     df = pd.read_parquet(path)
-    return df if len(df) >= 20 else None
+    if len(df) < 20:
+        return None
+    # Lets compute_all() find the on-disk indicator cache for this frame
+    df.attrs["symbol"] = path.name[: -len(".parquet")]
+    return df
 
 
 def save_ohlcv(symbol: str, df: pd.DataFrame) -> Path:
@@ -84,6 +91,63 @@ def get_latest_price(symbol: str) -> float | None:
     return float(df["Close"].iloc[-1])
 
 
+# =============================================================================
+# INDICATOR CACHE (memory-mapped, invalidated by OHLCV parquet mtime)
+# =============================================================================
+
+# Field holding the producer's version stamp (see save_indicator_cache)
+IND_CACHE_VERSION_FIELD = "_version"
+
+
+def load_indicator_cache(symbol: str, version: int) -> np.ndarray | None:
+    """Memory-map cached indicator columns for a symbol.
+
+    Returns a structured array (one named float64 field per column), or
+    None if missing, older than the OHLCV parquet it was built from, or
+    stamped with a different `version` than the caller computes.
+    """
+    path = IND_CACHE_DIR / f"{symbol}.npy"
+    src = CACHE_DIR / f"{symbol}.parquet"
+    if not path.exists() or not src.exists():
+        return None
+    if path.stat().st_mtime <= src.stat().st_mtime:
+        return None
+    try:
+        cached = np.load(path, mmap_mode="r")
+    except (OSError, ValueError):
+        return None
+    names = cached.dtype.names or ()
+    if IND_CACHE_VERSION_FIELD not in names or len(cached) == 0:
+        return None
+    if cached[IND_CACHE_VERSION_FIELD][0] != version:
+        return None
+    return cached
+
+
+def save_indicator_cache(symbol: str, columns: dict[str, np.ndarray], version: int) -> Path:
+    """Write indicator columns to a named-field memory-mapped .npy file.
+
+    `version` (an integer fingerprint of the code and parameters that
+    produced the columns) is stored as an extra field; loads with a
+    different version are rejected.
+    """
+    IND_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = IND_CACHE_DIR / f"{symbol}.npy"
+    # Per-process temp name: concurrent runs must not write the same file
+    tmp = IND_CACHE_DIR / f"{symbol}.{os.getpid()}.tmp.npy"
+    dtype = np.dtype([(name, "f8") for name in columns] + [(IND_CACHE_VERSION_FIELD, "f8")])
+    n = len(next(iter(columns.values())))
+    out = np.lib.format.open_memmap(tmp, mode="w+", dtype=dtype, shape=(n,))
+    for name, arr in columns.items():
+        out[name] = arr
+    out[IND_CACHE_VERSION_FIELD] = version
+    out.flush()
+    del out
+    # Atomic swap so concurrent readers never see a half-written file
+    tmp.replace(path)
+    return path
+
+
 # =============================================================================
 # CACHE METADATA
 # =============================================================================
@@ -266,14 +330,30 @@ def save_scan_ta(symbol: str, indicator: str, data: dict) -> None:
 # =============================================================================
 
 
+def latest_scan_file(scan_dir: Path = SCAN_DIR) -> Path | None:
+    """Newest scan_*.json in scan_dir by filename, or None.
+
+    scan_YYYYMMDD_HHMMSS names sort chronologically, so a single scandir
+    pass keeping the max name replaces listing and sorting every scan.
+    """
+    latest = None
+    try:
+        with os.scandir(scan_dir) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith("scan_") and name.endswith(".json") and (latest is None or name > latest):
+                    latest = name
+    except FileNotFoundError:
+        return None
+    return scan_dir / latest if latest is not None else None
+
+
 def load_latest_scan() -> dict | None:
     """Load the most recent scan file by filename sort."""
-    if not SCAN_DIR.exists():
-        return None
-    files = sorted(SCAN_DIR.glob("scan_*.json"))
-    if not files:
+    path = latest_scan_file()
+    if path is None:
         return None
-    return load_json(files[-1])
+    return load_json(path)
 
 
 def save_scan(data: dict) -> Path:
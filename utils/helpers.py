@@ -107,7 +107,9 @@ def load_json(path: Path) -> dict | list | None:
 
 
 def save_json(path: Path, data: dict | list) -> None:
-    """Save data to JSON file."""
+    """Save data to JSON file (atomic: readers never see a partial write)."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w") as f:
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w") as f:
         json.dump(data, f, indent=2, default=str)
+    tmp.replace(path)
@@ -4,9 +4,17 @@ All indicator computation lives here. Individual TA scripts import
 pre-computed indicators instead of recomputing them independently.
 """
 
+import functools
+import importlib.metadata
+import zlib
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
-import pandas_ta as ta
 
+from utils import data as data_layer
+from utils import kernels
+from utils import ta_config
 from utils.ta_config import (
     RSI_PERIOD,
     MACD_FAST, MACD_SLOW, MACD_SIGNAL,
@@ -17,7 +25,54 @@ from utils.ta_config import (
     ATR_PERIOD,
     VOLUME_SMA_PERIOD,
 )
-from utils.ta_common import safe_round
+from utils.ta_common import safe_round_array
+
+# pandas_ta (still used for Stoch RSI and ATR) pulls in a lot at import
+# time. Defer it until an indicator is actually computed so helpers like
+# find_swing_points() stay cheap to import for one-shot CLI runs.
+_ta_module = None
+
+
+def _get_ta():
+    global _ta_module
+    if _ta_module is None:
+        import pandas_ta as _ta
+        _ta_module = _ta
+    return _ta_module
+
+
+@functools.cache
+def _indicator_cache_version() -> int:
+    """Fingerprint of everything the cached columns depend on.
+
+    Covers the ta_config parameters, the source of this module and
+    utils/kernels.py, and the pandas_ta version (Stoch RSI, ATR), so
+    editing any of them invalidates existing indicator caches.
+    """
+    params = {k: v for k, v in vars(ta_config).items() if k.isupper()}
+    version = zlib.crc32(repr(params).encode())
+    for src in (Path(__file__), Path(kernels.__file__)):
+        version = zlib.crc32(src.read_bytes(), version)
+    try:
+        ta_version = importlib.metadata.version("pandas-ta")
+    except importlib.metadata.PackageNotFoundError:
+        ta_version = ""
+    return zlib.crc32(ta_version.encode(), version)
+
+
+def _from_indicator_cache(df: pd.DataFrame, symbol: str) -> pd.DataFrame | None:
+    """Rebuild the enriched df from the memory-mapped cache, if it matches."""
+    cached = data_layer.load_indicator_cache(symbol, _indicator_cache_version())
+    if cached is None or len(cached) != len(df) or "Close" not in cached.dtype.names:
+        return None
+    # Guard against slices/edits of the cached frame reusing stale columns
+    if not np.array_equal(cached["Close"], df["Close"].to_numpy(dtype=np.float64), equal_nan=True):
+        return None
+    df = df.copy()
+    for name in cached.dtype.names:
+        if name not in df.columns and name != data_layer.IND_CACHE_VERSION_FIELD:
+            df[name] = np.asarray(cached[name])
+    return df
 
 
 def compute_all(df: pd.DataFrame) -> dict:
@@ -25,42 +80,64 @@ def compute_all(df: pd.DataFrame) -> dict:
 
     Returns a dict with all indicator Series/DataFrames plus the enriched df.
     Individual TA scripts read from this instead of recomputing.
+
+    Frames loaded via utils.data.load_ohlcv() carry their symbol in
+    df.attrs; for those, results are shared across scripts through the
+    on-disk indicator cache until the OHLCV parquet changes.
     """
+    symbol = df.attrs.get("symbol")
+    if symbol:
+        cached = _from_indicator_cache(df, symbol)
+        if cached is not None:
+            return {"df": cached}
+
+    source_cols = set(df.columns)
     df = df.copy()
 
+    def arr(col):
+        return np.ascontiguousarray(df[col].to_numpy(dtype=np.float64))
+
+    close, high, low = arr("Close"), arr("High"), arr("Low")
+    n = len(df)
+
+    # Core indicators come from utils.kernels (pandas_ta math, no wrapper
+    # overhead). The length guards mirror pandas_ta's minimum-length checks
+    # so short frames get the same columns as before.
+
     # RSI
-    df["rsi"] = ta.rsi(df["Close"], length=RSI_PERIOD)
+    df["rsi"] = kernels.rsi(close, RSI_PERIOD)
 
     # MACD
-    macd_result = ta.macd(df["Close"], fast=MACD_FAST, slow=MACD_SLOW, signal=MACD_SIGNAL)
-    if macd_result is not None:
-        df["macd"] = macd_result.iloc[:, 0]
-        df["macd_hist"] = macd_result.iloc[:, 1]
-        df["macd_signal"] = macd_result.iloc[:, 2]
+    if n >= MACD_SLOW + MACD_SIGNAL - 1:
+        macd_line, macd_signal, macd_hist = kernels.macd(close, MACD_FAST, MACD_SLOW, MACD_SIGNAL)
+        df["macd"] = macd_line
+        df["macd_hist"] = macd_hist
+        df["macd_signal"] = macd_signal
 
     # SMAs
-    df["sma20"] = ta.sma(df["Close"], length=SMA_FAST)
-    df["sma50"] = ta.sma(df["Close"], length=SMA_MID)
-    if len(df) >= SMA_SLOW:
-        df["sma200"] = ta.sma(df["Close"], length=SMA_SLOW)
+    df["sma20"] = kernels.sma(close, SMA_FAST)
+    df["sma50"] = kernels.sma(close, SMA_MID)
+    if n >= SMA_SLOW:
+        df["sma200"] = kernels.sma(close, SMA_SLOW)
 
     # Bollinger Bands
-    bbands = ta.bbands(df["Close"], length=BB_PERIOD, std=BB_STD)
-    if bbands is not None:
-        df["bb_lower"] = bbands.iloc[:, 0]
-        df["bb_middle"] = bbands.iloc[:, 1]
-        df["bb_upper"] = bbands.iloc[:, 2]
-        df["bb_bandwidth"] = bbands.iloc[:, 3]
-        df["bb_pctb"] = bbands.iloc[:, 4]
+    if n >= BB_PERIOD:
+        lower, middle, upper, bandwidth, pctb = kernels.bbands(close, BB_PERIOD, float(BB_STD))
+        df["bb_lower"] = lower
+        df["bb_middle"] = middle
+        df["bb_upper"] = upper
+        df["bb_bandwidth"] = bandwidth
+        df["bb_pctb"] = pctb
 
     # ADX
-    adx_result = ta.adx(df["High"], df["Low"], df["Close"], length=ADX_PERIOD)
-    if adx_result is not None:
-        df["adx"] = adx_result.iloc[:, 0]
-        df["plus_di"] = adx_result.iloc[:, 1]
-        df["minus_di"] = adx_result.iloc[:, 2]
+    if n >= ADX_PERIOD + 1:
+        adx, plus_di, minus_di = kernels.adx(high, low, close, ADX_PERIOD)
+        df["adx"] = adx
+        df["plus_di"] = plus_di
+        df["minus_di"] = minus_di
 
     # Stochastic RSI
+    ta = _get_ta()
     stochrsi = ta.stochrsi(
         df["Close"], length=STOCH_RSI_LENGTH,
         rsi_length=RSI_PERIOD, k=STOCH_RSI_K, d=STOCH_RSI_D,
@@ -73,9 +150,19 @@ def compute_all(df: pd.DataFrame) -> dict:
     df["atr"] = ta.atr(df["High"], df["Low"], df["Close"], length=ATR_PERIOD)
 
     # Volume
-    df["vol_sma20"] = ta.sma(df["Volume"], length=VOLUME_SMA_PERIOD)
+    df["vol_sma20"] = kernels.sma(arr("Volume"), VOLUME_SMA_PERIOD)
     df["vol_ratio"] = df["Volume"] / df["vol_sma20"]
 
+    if symbol:
+        columns = {"Close": df["Close"].to_numpy(dtype=np.float64)}
+        for col in df.columns:
+            if col not in source_cols:
+                columns[col] = df[col].to_numpy(dtype=np.float64)
+        try:
+            data_layer.save_indicator_cache(symbol, columns, _indicator_cache_version())
+        except OSError:
+            pass  # Cache is an optimization; never fail the analysis
+
     return {"df": df}
 
 
@@ -106,62 +193,66 @@ def extract_latest(df: pd.DataFrame) -> dict:
     Returns a flat dict of the most recent indicator values, ready for
     signal interpretation by individual TA scripts.
     """
-    latest = df.iloc[-1]
-    prev = df.iloc[-2] if len(df) > 1 else latest
-
-    def sf(val, decimals=4):
-        return safe_round(val, decimals)
-
-    result = {
-        "price": sf(latest["Close"], 2),
-        "open": sf(latest["Open"], 2),
-        "high": sf(latest["High"], 2),
-        "low": sf(latest["Low"], 2),
-        "volume": int(latest["Volume"]) if pd.notna(latest["Volume"]) else None,
+    # Read scalars straight from the column arrays — avoids building a
+    # row Series (and its index lookups) for every field below.
+    cols = {c: df[c].to_numpy() for c in df.columns}
+    latest = {c: arr[-1] for c, arr in cols.items()}
+    prev = {c: arr[-2] for c, arr in cols.items()} if len(df) > 1 else latest
+
+    # (key, value, decimals) — rounded together in one vectorized pass
+    fields = [
+        ("price", latest["Close"], 2),
+        ("open", latest["Open"], 2),
+        ("high", latest["High"], 2),
+        ("low", latest["Low"], 2),
 
         # RSI
-        "rsi": sf(latest.get("rsi"), 2),
-        "rsi_prev": sf(prev.get("rsi"), 2),
+        ("rsi", latest.get("rsi"), 2),
+        ("rsi_prev", prev.get("rsi"), 2),
 
         # MACD
-        "macd": sf(latest.get("macd")),
-        "macd_signal": sf(latest.get("macd_signal")),
-        "macd_hist": sf(latest.get("macd_hist")),
-        "macd_prev": sf(prev.get("macd")),
-        "macd_signal_prev": sf(prev.get("macd_signal")),
-        "macd_hist_prev": sf(prev.get("macd_hist")),
+        ("macd", latest.get("macd"), 4),
+        ("macd_signal", latest.get("macd_signal"), 4),
+        ("macd_hist", latest.get("macd_hist"), 4),
+        ("macd_prev", prev.get("macd"), 4),
+        ("macd_signal_prev", prev.get("macd_signal"), 4),
+        ("macd_hist_prev", prev.get("macd_hist"), 4),
 
         # SMAs
-        "sma20": sf(latest.get("sma20"), 2),
-        "sma50": sf(latest.get("sma50"), 2),
-        "sma200": sf(latest.get("sma200"), 2) if "sma200" in df.columns else None,
+        ("sma20", latest.get("sma20"), 2),
+        ("sma50", latest.get("sma50"), 2),
+        ("sma200", latest.get("sma200"), 2),
 
         # Bollinger
-        "bb_lower": sf(latest.get("bb_lower"), 2),
-        "bb_middle": sf(latest.get("bb_middle"), 2),
-        "bb_upper": sf(latest.get("bb_upper"), 2),
-        "bb_pctb": sf(latest.get("bb_pctb")),
-        "bb_bandwidth": sf(latest.get("bb_bandwidth")),
+        ("bb_lower", latest.get("bb_lower"), 2),
+        ("bb_middle", latest.get("bb_middle"), 2),
+        ("bb_upper", latest.get("bb_upper"), 2),
+        ("bb_pctb", latest.get("bb_pctb"), 4),
+        ("bb_bandwidth", latest.get("bb_bandwidth"), 4),
 
         # ADX
-        "adx": sf(latest.get("adx"), 2),
-        "plus_di": sf(latest.get("plus_di"), 2),
-        "minus_di": sf(latest.get("minus_di"), 2),
-        "adx_prev": sf(prev.get("adx"), 2),
+        ("adx", latest.get("adx"), 2),
+        ("plus_di", latest.get("plus_di"), 2),
+        ("minus_di", latest.get("minus_di"), 2),
+        ("adx_prev", prev.get("adx"), 2),
 
         # Stoch RSI
-        "stoch_rsi_k": sf(latest.get("stoch_rsi_k"), 2),
-        "stoch_rsi_d": sf(latest.get("stoch_rsi_d"), 2),
-        "stoch_rsi_k_prev": sf(prev.get("stoch_rsi_k"), 2),
-        "stoch_rsi_d_prev": sf(prev.get("stoch_rsi_d"), 2),
+        ("stoch_rsi_k", latest.get("stoch_rsi_k"), 2),
+        ("stoch_rsi_d", latest.get("stoch_rsi_d"), 2),
+        ("stoch_rsi_k_prev", prev.get("stoch_rsi_k"), 2),
+        ("stoch_rsi_d_prev", prev.get("stoch_rsi_d"), 2),
 
         # ATR
-        "atr": sf(latest.get("atr"), 2),
+        ("atr", latest.get("atr"), 2),
 
         # Volume
-        "vol_sma20": int(latest["vol_sma20"]) if pd.notna(latest.get("vol_sma20")) else None,
-        "vol_ratio": sf(latest.get("vol_ratio"), 2),
-        "is_up_day": bool(latest["Close"] >= latest["Open"]),
-    }
+        ("vol_ratio", latest.get("vol_ratio"), 2),
+    ]
+    keys, values, decimals = zip(*fields)
+    result = dict(zip(keys, safe_round_array(values, decimals)))
+
+    result["volume"] = int(latest["Volume"]) if pd.notna(latest["Volume"]) else None
+    result["vol_sma20"] = int(latest["vol_sma20"]) if pd.notna(latest.get("vol_sma20")) else None
+    result["is_up_day"] = bool(latest["Close"] >= latest["Open"])
 
     return result
@@ -0,0 +1,632 @@
+"""NumPy/Numba indicator kernels — pandas_ta math without the pandas_ta wrappers.
+
+sma/rsi/macd/bbands/atr/adx take float64 arrays and return full-length
+arrays; compute_all() builds its columns from them. compute_scalars()
+runs all of them in one compiled call and keeps only the latest values
+that compute_technical_indicators() scores.
+
+The math mirrors pandas_ta (EMA seeded with an SMA, Wilder/RMA smoothing,
+sample-stdev Bollinger Bands, non_zero_range epsilon) so results match
+the library to floating-point noise.
+
+Numba is optional — it ships as a pandas_ta dependency, but if it is
+missing the same functions run as plain Python. Compiled code is cached
+on disk (cache=True, next to this module); batch runners call warmup()
+once before forking workers so no worker compiles or reloads it.
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+from utils.ta_config import (
+    RSI_PERIOD,
+    MACD_FAST, MACD_SLOW, MACD_SIGNAL,
+    BB_PERIOD, BB_STD,
+    ADX_PERIOD,
+    SMA_MID, SMA_SLOW,
+    VOLUME_SMA_PERIOD,
+)
+
+# Layout of the array returned by compute_scalars()
+SCALAR_FIELDS = (
+    "close", "open",
+    "rsi",
+    "macd", "macd_signal", "macd_hist", "macd_prev", "macd_signal_prev",
+    "sma50", "sma200",
+    "bb_lower", "bb_middle", "bb_upper", "bb_pctb",
+    "adx", "plus_di", "minus_di",
+    "vol_sma20", "vol_ratio",
+)
+N_SCALARS = len(SCALAR_FIELDS)
+
+_EPS = np.finfo(np.float64).eps
+
+# Score lookup tables: score = SCORES[np.searchsorted(THRESHOLDS, x, side="right")].
+# side="right" makes each threshold the inclusive lower edge of the next
+# bucket; np.nextafter() turns one into an exclusive edge (e.g. ADX "> 25").
+RSI_THRESHOLDS = np.array([25, 35, 55, 70, 80], dtype=np.float64)
+RSI_SCORES = np.array([4, 7, 6, 5, 4, 3], dtype=np.int8)
+
+BB_THRESHOLDS = np.array([0, 0.2, 0.5, 0.8, np.nextafter(1.0, np.inf)], dtype=np.float64)
+BB_SCORES = np.array([3, 5, 6, 6, 5, 4], dtype=np.int8)
+
+ADX_THRESHOLDS = np.array([20, np.nextafter(25, np.inf), np.nextafter(30, np.inf)], dtype=np.float64)
+ADX_UP_SCORES = np.array([4, 5, 7, 9], dtype=np.int8)
+ADX_DN_SCORES = np.array([4, 5, 2, 2], dtype=np.int8)
+
+# MACD state: index = above_signal << 2 | rising << 1 | above_zero
+MACD_SCORES = np.array([2, 4, 2, 4, 5, 5, 7, 9], dtype=np.int8)
+
+VOL_THRESHOLDS = np.array([np.nextafter(1.5, np.inf), np.nextafter(2.0, np.inf)], dtype=np.float64)
+VOL_UP_SCORES = np.array([5, 7, 9], dtype=np.int8)
+VOL_DN_SCORES = np.array([5, 4, 2], dtype=np.int8)
+
+# Weight order expected by score_batch()
+SCORE_KEYS = ("rsi", "macd", "trend", "bollinger", "adx", "volume")
+
+
+@njit(cache=True, inline="always")
+def _ewm_step(weighted, old_wt, cur, alpha):
+    """One pandas `ewm(alpha=..., adjust=False)` update; returns (weighted, old_wt).
+
+    NaN inputs carry the previous value forward and decay its weight,
+    exactly like pandas (ignore_na=False).
+    """
+    if weighted == weighted:
+        old_wt *= 1.0 - alpha
+        if cur == cur:
+            if weighted != cur:
+                weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+            old_wt = 1.0
+    elif cur == cur:
+        weighted = cur
+    return weighted, old_wt
+
+
+@njit(cache=True)
+def _ewm(x, alpha, start):
+    """pandas `ewm(alpha=..., adjust=False).mean()` over x[start:] (NaN before)."""
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    if start >= n:
+        return out
+    weighted = x[start]
+    old_wt = 1.0
+    out[start] = weighted
+    for i in range(start + 1, n):
+        weighted, old_wt = _ewm_step(weighted, old_wt, x[i], alpha)
+        out[i] = weighted
+    return out
+
+
+@njit(cache=True)
+def _ema(x, length, start):
+    """pandas_ta EMA over x[start:]: SMA of the first `length` values as seed."""
+    n = x.shape[0]
+    if n - start < length:
+        return np.full(n, np.nan)
+    seed_sum = 0.0
+    seed_cnt = 0
+    for i in range(start, start + length):
+        if x[i] == x[i]:
+            seed_sum += x[i]
+            seed_cnt += 1
+    buf = x.copy()
+    buf[start + length - 1] = seed_sum / seed_cnt if seed_cnt > 0 else np.nan
+    return _ewm(buf, 2.0 / (length + 1), start + length - 1)
+
+
+@njit(cache=True)
+def sma(x, length):
+    """pandas_ta SMA (convolution, NaN until the window is full)."""
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    if n < length:
+        return out
+    out[length - 1:] = np.convolve(np.ones(length) / length, x)[length - 1:n]
+    return out
+
+
+@njit(cache=True)
+def rsi(close, length):
+    """pandas_ta RSI (RMA of gains/losses)."""
+    n = close.shape[0]
+    if n < length + 1:
+        return np.full(n, np.nan)
+    gains = np.full(n, np.nan)
+    losses = np.full(n, np.nan)
+    for i in range(1, n):
+        diff = close[i] - close[i - 1]
+        if diff == diff:
+            gains[i] = diff if diff > 0 else 0.0
+            losses[i] = diff if diff < 0 else 0.0
+    alpha = 1.0 / length
+    avg_gain = _ewm(gains, alpha, 1)
+    avg_loss = _ewm(losses, alpha, 1)
+    return 100.0 * avg_gain / (avg_gain + np.abs(avg_loss))
+
+
+@njit(cache=True)
+def macd(close, fast, slow, signal):
+    """pandas_ta MACD line, signal and histogram."""
+    n = close.shape[0]
+    if n < slow + signal - 1:
+        empty = np.full(n, np.nan)
+        return empty, empty.copy(), empty.copy()
+    line = _ema(close, fast, 0) - _ema(close, slow, 0)
+    first = slow - 1
+    while first < n and line[first] != line[first]:
+        first += 1
+    sig = _ema(line, signal, first)
+    return line, sig, line - sig
+
+
+@njit(cache=True)
+def _non_zero_range(x, y):
+    """pandas_ta non_zero_range(): x - y, all nudged by epsilon if any is 0."""
+    diff = x - y
+    if np.any(diff == 0.0):
+        diff += _EPS
+    return diff
+
+
+@njit(cache=True)
+def bbands(close, length, std):
+    """pandas_ta Bollinger lower/middle/upper/bandwidth/%B (sample stdev)."""
+    n = close.shape[0]
+    mid = sma(close, length)
+    sd = np.full(n, np.nan)
+    for i in range(length - 1, n):
+        m = 0.0
+        for j in range(i - length + 1, i + 1):
+            m += close[j]
+        m /= length
+        ss = 0.0
+        flat = True
+        for j in range(i - length + 1, i + 1):
+            d = close[j] - m
+            ss += d * d
+            flat = flat and close[j] == close[i]
+        # pandas' rolling var is exactly 0 on an all-equal window
+        sd[i] = 0.0 if flat else math.sqrt(ss / (length - 1))
+    lower = mid - std * sd
+    upper = mid + std * sd
+    width = _non_zero_range(upper, lower)
+    bandwidth = 100.0 * width / mid
+    pctb = _non_zero_range(close, lower) / width
+    return lower, mid, upper, bandwidth, pctb
+
+
+@njit(cache=True)
+def _nanmax3(a, b, c):
+    """max() of three values ignoring NaNs (NaN only if all are NaN)."""
+    best = np.nan
+    for v in (a, b, c):
+        if v == v and not (best >= v):
+            best = v
+    return best
+
+
+@njit(cache=True)
+def atr(high, low, close, length, prenan=False):
+    """pandas_ta ATR: RMA of the true range, seeded with its first-`length` mean.
+
+    prenan=True drops the first bar's true range (it has no previous close),
+    as pandas_ta's adx() does; plain ta.atr() keeps it as high - low.
+    """
+    n = close.shape[0]
+    if n < length + 1:
+        return np.full(n, np.nan)
+
+    hl = _non_zero_range(high, low)
+    tr = np.full(n, np.nan)
+    if not prenan:
+        tr[0] = abs(hl[0])
+    for i in range(1, n):
+        pc = close[i - 1]
+        tr[i] = _nanmax3(abs(hl[i]), abs(high[i] - pc), abs(pc - low[i]))
+
+    seed_sum = 0.0
+    seed_cnt = 0
+    for i in range(length):
+        if tr[i] == tr[i]:
+            seed_sum += tr[i]
+            seed_cnt += 1
+    for i in range(length - 1):
+        tr[i] = np.nan
+    tr[length - 1] = seed_sum / seed_cnt if seed_cnt > 0 else np.nan
+    return _ewm(tr, 1.0 / length, length - 1)
+
+
+@njit(cache=True)
+def adx(high, low, close, length):
+    """pandas_ta ADX, +DI and -DI (Wilder smoothing, SMA-seeded ATR)."""
+    n = close.shape[0]
+    if n < length + 1:
+        empty = np.full(n, np.nan)
+        return empty, empty.copy(), empty.copy()
+
+    # Directional movement
+    pos = np.full(n, np.nan)
+    neg = np.full(n, np.nan)
+    for i in range(1, n):
+        up = high[i] - high[i - 1]
+        dn = low[i - 1] - low[i]
+        if up == up:
+            p = up if (up > dn and up > 0) else 0.0
+            pos[i] = 0.0 if abs(p) < _EPS else p
+        if dn == dn:
+            m = dn if (dn > up and dn > 0) else 0.0
+            neg[i] = 0.0 if abs(m) < _EPS else m
+
+    alpha = 1.0 / length
+    k = 100.0 / atr(high, low, close, length, True)
+    dmp = k * _ewm(pos, alpha, 1)
+    dmn = k * _ewm(neg, alpha, 1)
+    dx = 100.0 * np.abs(dmp - dmn) / (dmp + dmn)
+
+    first = 0
+    while first < n and dx[first] != dx[first]:
+        first += 1
+    return _ewm(dx, alpha, first), dmp, dmn
+
+
+# -----------------------------------------------------------------------------
+# Tail kernels: same recurrences as above, but with scalar running state and
+# no intermediate arrays — for callers that only need the latest values.
+# -----------------------------------------------------------------------------
+
+
+@njit(cache=True)
+def sma_tail(x, length):
+    """Latest value of sma(x, length); NaN when the window is not full."""
+    n = x.shape[0]
+    if n < length:
+        return np.nan
+    total = 0.0
+    for i in range(n - length, n):
+        total += x[i]
+    return total / length
+
+
+@njit(cache=True)
+def rsi_tail(close, length):
+    """Latest value of rsi(close, length)."""
+    n = close.shape[0]
+    if n < length + 1:
+        return np.nan
+    alpha = 1.0 / length
+    gain = loss = np.nan
+    gain_wt = loss_wt = 1.0
+    for i in range(1, n):
+        diff = close[i] - close[i - 1]
+        g = l = np.nan
+        if diff == diff:
+            g = diff if diff > 0 else 0.0
+            l = diff if diff < 0 else 0.0
+        if i == 1:
+            gain, loss = g, l
+        else:
+            gain, gain_wt = _ewm_step(gain, gain_wt, g, alpha)
+            loss, loss_wt = _ewm_step(loss, loss_wt, l, alpha)
+    # Scalar x / 0 raises in compiled code; a flat series gives NaN as in rsi()
+    total = gain + abs(loss)
+    return 100.0 * gain / total if total != 0.0 else np.nan
+
+
+@njit(cache=True)
+def macd_tail(close, fast, slow, signal):
+    """Latest (line, signal, histogram, previous line, previous signal) of macd()."""
+    n = close.shape[0]
+    if n < slow + signal - 1:
+        return np.nan, np.nan, np.nan, np.nan, np.nan
+    a_fast = 2.0 / (fast + 1)
+    a_slow = 2.0 / (slow + 1)
+    a_sig = 2.0 / (signal + 1)
+    ema_f = ema_s = sig = np.nan
+    wt_f = wt_s = wt_sig = 1.0
+    sum_f = sum_s = sum_sig = 0.0
+    cnt_f = cnt_s = cnt_sig = 0
+    first = -1  # first bar with a valid MACD line (signal EMA starts there)
+    line = line_prev = sig_prev = np.nan
+    for i in range(n):
+        x = close[i]
+        # Each EMA: NaN-skipping SMA seed at bar length-1, then ewm updates
+        if i < fast:
+            if x == x:
+                sum_f += x
+                cnt_f += 1
+            if i == fast - 1:
+                ema_f = sum_f / cnt_f if cnt_f > 0 else np.nan
+        else:
+            ema_f, wt_f = _ewm_step(ema_f, wt_f, x, a_fast)
+        if i < slow:
+            if x == x:
+                sum_s += x
+                cnt_s += 1
+            if i == slow - 1:
+                ema_s = sum_s / cnt_s if cnt_s > 0 else np.nan
+        else:
+            ema_s, wt_s = _ewm_step(ema_s, wt_s, x, a_slow)
+
+        line_prev, sig_prev = line, sig
+        line = ema_f - ema_s
+        if first < 0:
+            if i < slow - 1 or line != line:
+                continue
+            first = i
+        k = i - first
+        if k < signal:
+            if line == line:
+                sum_sig += line
+                cnt_sig += 1
+            if k == signal - 1:
+                sig = sum_sig / cnt_sig if cnt_sig > 0 else np.nan
+        else:
+            sig, wt_sig = _ewm_step(sig, wt_sig, line, a_sig)
+    return line, sig, line - sig, line_prev, sig_prev
+
+
+@njit(cache=True)
+def bbands_tail(close, length, std):
+    """Latest (lower, middle, upper, %B) of bbands(), from the last window only."""
+    n = close.shape[0]
+    if n < length:
+        return np.nan, np.nan, np.nan, np.nan
+    # Same convolution as sma(), so a flat window's mid (and so its %B)
+    # carries the same rounding as bbands()
+    mid = np.convolve(np.ones(length) / length, close[n - length:])[length - 1]
+    # Two-pass sample variance (ddof=1, as pandas_ta) — E[x^2] - E[x]^2
+    # would cancel badly at equity price levels. An all-equal window is
+    # exactly 0, as in pandas' rolling var, not rounding noise.
+    ss = 0.0
+    flat = True
+    for i in range(n - length, n):
+        d = close[i] - mid
+        ss += d * d
+        flat = flat and close[i] == close[n - 1]
+    sd = 0.0 if flat else math.sqrt(ss / (length - 1))
+    lower = mid - std * sd
+    upper = mid + std * sd
+    # non_zero_range(): pandas_ta nudges zero widths/offsets by epsilon
+    width = upper - lower
+    if width == 0.0:
+        width = _EPS
+    offset = close[n - 1] - lower
+    if offset == 0.0:
+        offset = _EPS
+    return lower, mid, upper, offset / width
+
+
+@njit(cache=True)
+def adx_tail(high, low, close, length):
+    """Latest (adx, +DI, -DI) of adx()."""
+    n = close.shape[0]
+    if n < length + 1:
+        return np.nan, np.nan, np.nan
+    alpha = 1.0 / length
+    atr = pos_avg = neg_avg = adx_ = np.nan
+    atr_wt = pos_wt = neg_wt = adx_wt = 1.0
+    tr_sum = 0.0
+    tr_cnt = 0
+    adx_started = False
+    dmp = dmn = np.nan
+    for i in range(1, n):
+        pc = close[i - 1]
+        tr = _nanmax3(abs(high[i] - low[i]), abs(high[i] - pc), abs(pc - low[i]))
+        up = high[i] - high[i - 1]
+        dn = low[i - 1] - low[i]
+        p = m = np.nan
+        if up == up:
+            p = up if (up > dn and up > 0) else 0.0
+            p = 0.0 if abs(p) < _EPS else p
+        if dn == dn:
+            m = dn if (dn > up and dn > 0) else 0.0
+            m = 0.0 if abs(m) < _EPS else m
+
+        # ATR: RMA seeded with the mean of the first `length` true ranges
+        if i < length:
+            if tr == tr:
+                tr_sum += tr
+                tr_cnt += 1
+            if i == length - 1:
+                atr = tr_sum / tr_cnt if tr_cnt > 0 else np.nan
+        else:
+            atr, atr_wt = _ewm_step(atr, atr_wt, tr, alpha)
+
+        if i == 1:
+            pos_avg, neg_avg = p, m
+        else:
+            pos_avg, pos_wt = _ewm_step(pos_avg, pos_wt, p, alpha)
+            neg_avg, neg_wt = _ewm_step(neg_avg, neg_wt, m, alpha)
+
+        # Flat prices: zero ATR takes adx()'s non_zero_range epsilon (DIs of 0)
+        # and a zero DM sum gives NaN, instead of raising
+        k = 100.0 / (atr if atr != 0.0 else _EPS) if i >= length - 1 else np.nan
+        dmp = k * pos_avg
+        dmn = k * neg_avg
+        dm_sum = dmp + dmn
+        dx = 100.0 * abs(dmp - dmn) / dm_sum if dm_sum != 0.0 else np.nan
+        if adx_started:
+            adx_, adx_wt = _ewm_step(adx_, adx_wt, dx, alpha)
+        elif dx == dx:
+            adx_ = dx
+            adx_started = True
+    return adx_, dmp, dmn
+
+
+@njit(cache=True)
+def compute_scalars(open_, high, low, close, volume,
+                    rsi_len, macd_fast, macd_slow, macd_signal,
+                    bb_len, bb_std, adx_len, sma_mid, sma_slow, vol_len):
+    """One call into compiled code per symbol; returns values in SCALAR_FIELDS order."""
+    n = close.shape[0]
+    out = np.full(N_SCALARS, np.nan)
+    out[0] = close[n - 1]
+    out[1] = open_[n - 1]
+    out[2] = rsi_tail(close, rsi_len)
+    out[3], out[4], out[5], out[6], out[7] = macd_tail(close, macd_fast, macd_slow, macd_signal)
+    out[8] = sma_tail(close, sma_mid)
+    out[9] = sma_tail(close, sma_slow)
+    out[10], out[11], out[12], out[13] = bbands_tail(close, bb_len, bb_std)
+    out[14], out[15], out[16] = adx_tail(high, low, close, adx_len)
+    out[17] = sma_tail(volume, vol_len)
+    # Index tickers and suspended stocks trade no volume; a scalar x / 0
+    # raises in compiled code, where pandas would give NaN
+    if out[17] != 0.0:
+        out[18] = volume[n - 1] / out[17]
+    return out
+
+
+def technical_scalars(df: pd.DataFrame) -> dict:
+    """Latest scoring inputs for an OHLCV frame, keyed by SCALAR_FIELDS."""
+    def col(name):
+        return np.ascontiguousarray(df[name].to_numpy(dtype=np.float64))
+
+    values = compute_scalars(
+        col("Open"), col("High"), col("Low"), col("Close"), col("Volume"),
+        RSI_PERIOD, MACD_FAST, MACD_SLOW, MACD_SIGNAL,
+        BB_PERIOD, float(BB_STD), ADX_PERIOD, SMA_MID, SMA_SLOW, VOLUME_SMA_PERIOD,
+    )
+    return dict(zip(SCALAR_FIELDS, values.tolist()))
+
+
+# =============================================================================
+# SCORING (compiled twins of the score_* functions in technical_analysis.py)
+# =============================================================================
+
+
+@njit(cache=True, inline="always")
+def score_rsi(rsi):
+    if rsi != rsi:
+        return 5
+    return RSI_SCORES[np.searchsorted(RSI_THRESHOLDS, rsi, side="right")]
+
+
+@njit(cache=True, inline="always")
+def score_macd(macd, signal, prev_macd):
+    if macd != macd or signal != signal:
+        return 5
+    above_signal = macd > signal
+    rising = macd > prev_macd if prev_macd == prev_macd else True
+    return MACD_SCORES[(above_signal << 2) | (rising << 1) | (macd > 0)]
+
+
+@njit(cache=True, inline="always")
+def score_trend(close, sma50, sma200):
+    if sma50 != sma50:
+        return 5
+    if sma200 != sma200:
+        return 7 if close > sma50 else 3
+    if close > sma50 > sma200:
+        return 9
+    if close > sma200 > sma50:
+        return 7
+    if close > sma50 and sma50 < sma200:
+        return 5
+    if sma50 > sma200 and close < sma50:
+        return 5
+    if close < sma50 < sma200:
+        return 2
+    return 4
+
+
+@njit(cache=True, inline="always")
+def score_bollinger(pctb):
+    if pctb != pctb:
+        return 5
+    return BB_SCORES[np.searchsorted(BB_THRESHOLDS, pctb, side="right")]
+
+
+@njit(cache=True, inline="always")
+def score_adx(adx, plus_di, minus_di):
+    if adx != adx:
+        return 5
+    uptrend = plus_di > minus_di if (plus_di == plus_di and minus_di == minus_di) else True
+    idx = np.searchsorted(ADX_THRESHOLDS, adx, side="right")
+    return ADX_UP_SCORES[idx] if uptrend else ADX_DN_SCORES[idx]
+
+
+@njit(cache=True, inline="always")
+def score_volume(vol_ratio, is_up_day):
+    if vol_ratio != vol_ratio:
+        return 5
+    idx = np.searchsorted(VOL_THRESHOLDS, vol_ratio, side="right")
+    return VOL_UP_SCORES[idx] if is_up_day else VOL_DN_SCORES[idx]
+
+
+@njit(cache=True, inline="always")
+def _sum_add(total, comp, x):
+    """Neumaier step — the compensated summation Python's sum() uses for floats."""
+    t = total + x
+    if abs(total) >= abs(x):
+        comp += (total - t) + x
+    else:
+        comp += (x - t) + total
+    return t, comp
+
+
+@njit(cache=True, parallel=True)
+def score_batch(rsi, macd, macd_signal, macd_prev, close, sma50, sma200,
+                pctb, adx, plus_di, minus_di, vol_ratio, is_up_day, weights):
+    """Weighted technical score for every row (symbols or bars).
+
+    All inputs are 1-D arrays of equal length; `weights` follows SCORE_KEYS.
+    Returns the unrounded weighted scores, summed exactly like Python's
+    sum() so rounding matches compute_technical_indicators().
+    """
+    n = rsi.shape[0]
+    out = np.empty(n)
+    for i in prange(n):
+        total, comp = 0.0, 0.0
+        total, comp = _sum_add(total, comp, score_rsi(rsi[i]) * weights[0])
+        total, comp = _sum_add(total, comp, score_macd(macd[i], macd_signal[i], macd_prev[i]) * weights[1])
+        total, comp = _sum_add(total, comp, score_trend(close[i], sma50[i], sma200[i]) * weights[2])
+        total, comp = _sum_add(total, comp, score_bollinger(pctb[i]) * weights[3])
+        total, comp = _sum_add(total, comp, score_adx(adx[i], plus_di[i], minus_di[i]) * weights[4])
+        total, comp = _sum_add(total, comp, score_volume(vol_ratio[i], is_up_day[i]) * weights[5])
+        out[i] = total + comp
+    return out
+
+
+def warmup() -> None:
+    """Compile (or load from the on-disk cache) every kernel the scripts call.
+
+    Call in a parent process before starting a worker pool: forked
+    workers inherit the compiled code, and spawned ones find a
+    populated cache instead of all compiling at once.
+    """
+    if not HAS_NUMBA:
+        return
+    writable = np.linspace(1.0, 2.0, 64)
+    readonly = writable.copy()
+    readonly.flags.writeable = False
+    # Same argument types as the real callers, so each call compiles (or
+    # loads) the specialization they will use. Numba specializes on
+    # writability too, and pandas hands out read-only column arrays.
+    for arr in (writable, readonly):
+        compute_scalars(arr, arr, arr, arr, arr, 14, 12, 26, 9, 20, 2.0, 14, 50, 200, 20)
+        sma(arr, 20)
+        sma_tail(arr, 20)
+        rsi(arr, 14)
+        macd(arr, 12, 26, 9)
+        bbands(arr, 20, 2.0)
+        atr(arr, arr, arr, 14)
+        adx(arr, arr, arr, 14)
+        score_batch(arr, arr, arr, arr, arr, arr, arr, arr, arr, arr, arr, arr,
+                    np.ones(64, dtype=np.bool_), np.ones(len(SCORE_KEYS)))
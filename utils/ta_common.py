@@ -7,6 +7,7 @@ NOTE: load_ohlcv() and output_result() delegate to utils.data internally.
 """
 
 import json
+import math
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -64,9 +65,37 @@ def log(msg: str) -> None:
 
 def safe_round(val, decimals: int = 4):
     """Safely round a value, handling NaN/None."""
-    if val is None or pd.isna(val):
+    if val is None:
         return None
-    return round(float(val), decimals)
+    try:
+        val = float(val)
+    except TypeError:
+        # pd.NA / NaT can't go through float(); only then pay for pd.isna
+        if pd.isna(val):
+            return None
+        raise
+    if math.isnan(val):
+        return None
+    return round(val, decimals)
+
+
+def safe_round_array(values, decimals=4) -> list:
+    """safe_round over a sequence of scalars in one pass.
+
+    `decimals` may be a single int or one per value. NaN/None become None,
+    everything else a Python float rounded with round() — np.round rounds
+    differently on ...5 ties, so it is not used here.
+    """
+    if isinstance(decimals, int):
+        decimals = [decimals] * len(values)
+    out = []
+    for v, d in zip(values, decimals):
+        if v is None:
+            out.append(None)
+            continue
+        v = float(v)
+        out.append(None if v != v else round(v, d))
+    return out
 
 
 def load_ohlcv(symbol: str) -> pd.DataFrame: